@@ -0,0 +1,87 @@
+"""Measure task_base cold start: import time in fresh interpreters, and time from constructing a task
+to entering its calc(). The task's calc, wait and clean_up are skipped, and exports queued while
+checking inputs (e.g. HIITask recomputing population density) are dropped instead of started.
+
+    python scripts/benchmark_startup.py --task task_base.HIITask --taskdate 2021-01-01
+"""
+import argparse
+import importlib
+import statistics
+import subprocess
+import sys
+import time
+
+IMPORT_SNIPPET = (
+    "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+)
+
+
+def import_times(module, runs):
+    times = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        times.append(float(out.strip().splitlines()[-1]))
+    return times
+
+
+def time_to_calc(task_path, runs, **kwargs):
+    module, _, classname = task_path.rpartition(".")
+    task_class = getattr(importlib.import_module(module), classname)
+    entered = {}
+
+    class Benchmarked(task_class):
+        def calc(self):
+            entered["calc"] = time.perf_counter()
+
+        def wait(self):
+            pass
+
+        def clean_up(self, **kwargs):
+            pass
+
+        def _queue_export(self, *args, **kwargs):
+            return None
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        task = Benchmarked(**kwargs)
+        task.run()
+        if "calc" not in entered:
+            raise RuntimeError(f"{task_path} did not reach calc(): status {task.status}")
+        times.append(entered.pop("calc") - start)
+    return times
+
+
+def report(label, times):
+    print(
+        f"{label}: median {statistics.median(times):.3f}s  "
+        f"min {min(times):.3f}s  max {max(times):.3f}s  ({len(times)} runs)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="task_base", help="module to time importing")
+    parser.add_argument("--task", help="dotted path of a task class to time to first calc()")
+    parser.add_argument("--taskdate")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    report(f"import {args.module}", import_times(args.module, args.runs))
+    if args.task:
+        kwargs = {"taskdate": args.taskdate} if args.taskdate else {}
+        # the first instance pays for process-wide setup (ee session, catalog); later ones reuse it
+        times = time_to_calc(args.task, args.runs, **kwargs)
+        report(f"{args.task} first instance to calc()", times[:1])
+        if len(times) > 1:
+            report(f"{args.task} later instances to calc()", times[1:])
+
+
+if __name__ == "__main__":
+    main()
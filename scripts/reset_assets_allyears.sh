@@ -1,18 +1,10 @@
 #!/bin/bash
 
-# `earthengine authenticate` before running
+# `earthengine authenticate` before running (or set SERVICE_ACCOUNT_KEY)
 
-dir=""
-asset=$1   # hii or water
 if [ $# -gt 1 ]
 then
-  dir="${1}/"  # driver
-  asset=$2
+  python -m task_base.archive hii "${2}" --driver "${1}" --start-year 2001 --end-year 2021  # driver asset
+else
+  python -m task_base.archive hii "${1}" --start-year 2001 --end-year 2021  # hii or water
 fi
-year=2001
-
-while [ $year -le 2021 ]; do
-  earthengine rm projects/HII/v1/"${dir}${asset}_archive/${asset}_${year}-01-01";
-  earthengine mv projects/HII/v1/"${dir}${asset}/${asset}_${year}-01-01" projects/HII/v1/"${dir}${asset}_archive/${asset}_${year}-01-01";
-  ((year++))
-done
@@ -3,4 +3,5 @@ from .geotask import GeoTask
 from .eetask import EETask, EETaskError, PROJECTS
 from .hiitask import HIITask
 from .scltask import SCLTask
-from .data_transfer import ConversionException
+from .data_transfer import ConversionException, TransferException
+from .runner import TaskRunner, TaskTiming
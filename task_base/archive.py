@@ -0,0 +1,113 @@
+import argparse
+from .eetask import EETask, PROJECTS
+
+
+# Moves dated assets from their working directories into archive directories, replacing whatever is
+# already archived under the same name. The plan comes from one listing of each source and archive
+# directory; removals and then moves run concurrently.
+class ArchiveTask(EETask):
+    ee_project = "SCL/v1"
+    SCL_ARCHIVE_DIRS = [
+        ("pothab/potential_habitat", "pothab/potential_habitat_archive"),
+        ("structural_habitat", "structural_habitat_archive"),
+        ("pothab/scl_image", "pothab/scl_image_archive"),
+        ("pothab/scl_polys", "pothab_archive"),
+        ("pothab/scl_restoration", "pothab_archive"),
+        ("pothab/scl_restoration_fragment", "pothab_archive"),
+        ("pothab/scl_species", "pothab_archive"),
+        ("pothab/scl_species_fragment", "pothab_archive"),
+        ("pothab/scl_survey", "pothab_archive"),
+        ("pothab/scl_survey_fragment", "pothab_archive"),
+        ("pothab/scl_scored", "pothab_archive"),
+        ("obs/adhoc", "obs_archive/adhoc"),
+        ("obs/ct", "obs_archive/ct"),
+        ("obs/ss", "obs_archive/ss"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        # [(source dir, archive dir)] relative to ee_rootdir; assets named `<source dir name>_<date>`
+        self.archive_dirs = kwargs.pop("archive_dirs")
+        self.archive_dates = kwargs.pop("archive_dates")
+        self.dry_run = kwargs.pop("dry_run", False)
+        super().__init__(*args, **kwargs)
+
+    def plan(self):
+        source_dirs = [f"{self.ee_rootdir}/{s}" for s, _ in self.archive_dirs]
+        archive_dirs = [f"{self.ee_rootdir}/{a}" for _, a in self.archive_dirs]
+        listings, _ = self._map_concurrent(
+            self._list_assets, source_dirs + archive_dirs
+        )
+
+        removals = []
+        moves = []
+        for source_dir, archive_dir in zip(source_dirs, archive_dirs):
+            source_ids = {a["id"] for a in listings.get(source_dir) or []}
+            archived_ids = {a["id"] for a in listings.get(archive_dir) or []}
+            name = source_dir.split("/")[-1]
+            for archive_date in self.archive_dates:
+                asset_name = f"{name}_{archive_date}"
+                if f"{source_dir}/{asset_name}" not in source_ids:
+                    continue
+                if f"{archive_dir}/{asset_name}" in archived_ids:
+                    removals.append(f"{archive_dir}/{asset_name}")
+                moves.append(
+                    (f"{source_dir}/{asset_name}", f"{archive_dir}/{asset_name}")
+                )
+        return removals, moves
+
+    def calc(self):
+        removals, moves = self.plan()
+        for asset_id in removals:
+            print(f"rm {asset_id}")
+        for old_assetid, new_assetid in moves:
+            print(f"mv {old_assetid} {new_assetid}")
+        if self.dry_run or not moves:
+            return
+
+        for archive_dir in {new.rsplit("/", 1)[0] for _, new in moves}:
+            self._ensure_asset_tree(archive_dir)
+        removed = self._rm_ee_many(removals)
+        moved = self._mv_ee_many(moves)
+        if not all(removed.values()) or not all(moved.values()):
+            raise RuntimeError("Not all assets could be archived")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive dated SCL or HII assets")
+    parser.add_argument("--dry-run", action="store_true")
+    subparsers = parser.add_subparsers(dest="project", required=True)
+
+    scl = subparsers.add_parser("scl", help="archive one date of SCL outputs")
+    scl.add_argument("date", help="YYYY-mm-dd")
+    scl.add_argument("--species", default="Panthera_tigris")
+    scl.add_argument("--scenario", default="canonical")
+
+    hii = subparsers.add_parser("hii", help="archive yearly HII layers")
+    hii.add_argument("asset", help="e.g. hii or water")
+    hii.add_argument("--driver", help="driver directory containing `asset`")
+    hii.add_argument("--start-year", type=int, default=2001)
+    hii.add_argument("--end-year", type=int, default=2021)
+
+    args = parser.parse_args()
+    if args.project == "scl":
+        task = ArchiveTask(
+            ee_rootdir=f"{PROJECTS}/SCL/v1/{args.species}/{args.scenario}",
+            archive_dirs=ArchiveTask.SCL_ARCHIVE_DIRS,
+            archive_dates=[args.date],
+            dry_run=args.dry_run,
+        )
+    else:
+        asset_dir = f"{args.driver}/{args.asset}" if args.driver else args.asset
+        task = ArchiveTask(
+            ee_rootdir=f"{PROJECTS}/HII/v1",
+            archive_dirs=[(asset_dir, f"{asset_dir}_archive")],
+            archive_dates=[
+                f"{year}-01-01" for year in range(args.start_year, args.end_year + 1)
+            ],
+            dry_run=args.dry_run,
+        )
+    task.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+
+FOLDER = "FOLDER"
+IMAGE_COLLECTION = "IMAGE_COLLECTION"
+CONTAINER_TYPES = [FOLDER, IMAGE_COLLECTION]
+
+
+# Local sqlite mirror of ee asset trees. `lister` is called with an asset id and must return the full
+# (paginated) `listAssets` result for it, or None if it is not a folder/collection.
+class AssetCatalog(object):
+    SCHEMA = [
+        """CREATE TABLE IF NOT EXISTS assets (
+            id TEXT PRIMARY KEY, parent TEXT NOT NULL, type TEXT NOT NULL, update_time TEXT
+        )""",
+        "CREATE INDEX IF NOT EXISTS assets_parent ON assets (parent)",
+        """CREATE TABLE IF NOT EXISTS listings (
+            parent TEXT PRIMARY KEY, listed_at REAL NOT NULL, update_time TEXT, missing INTEGER NOT NULL
+        )""",
+    ]
+
+    def __init__(
+        self,
+        path: str,
+        roots: Iterable[str],
+        lister: Callable[[str], Optional[List[dict]]],
+        max_age: float = 86400,
+    ):
+        self.roots = [r.strip("/") for r in roots]
+        self.lister = lister
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        try:
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._create_schema()
+        except sqlite3.Error:
+            print(f"Asset catalog {path} is not writable; using in-memory catalog")
+            self._db = sqlite3.connect(":memory:", check_same_thread=False)
+            self._create_schema()
+
+    def _create_schema(self):
+        with self._db:
+            for statement in self.SCHEMA:
+                self._db.execute(statement)
+
+    @staticmethod
+    def _parent(asset_id: str) -> str:
+        return asset_id.rsplit("/", 1)[0]
+
+    @staticmethod
+    def _as_asset(row) -> dict:
+        return {"id": row[0], "type": row[1], "updateTime": row[2]}
+
+    def covers(self, asset_id: str) -> bool:
+        asset_id = asset_id.strip("/")
+        return any(asset_id == r or asset_id.startswith(f"{r}/") for r in self.roots)
+
+    def _store_listing(self, parent, assets, parent_update_time=None):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM assets WHERE parent = ?", (parent,))
+            if assets is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, ?)",
+                    [
+                        (a["id"], parent, a["type"], a.get("updateTime"))
+                        for a in assets
+                    ],
+                )
+            self._db.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?)",
+                (parent, time.time(), parent_update_time, int(assets is None)),
+            )
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def _listing(self, parent):
+        rows = self._query(
+            "SELECT listed_at, update_time, missing FROM listings WHERE parent = ?",
+            (parent,),
+        )
+        return rows[0] if rows else None
+
+    # Directories are (re)listed lazily, when queried: if never listed, if listed more than `max_age`
+    # ago, or if the updateTime their parent's listing reports differs from the one at their last listing
+    def _ensure_listed(self, parent, force=False):
+        listing = self._listing(parent)
+        rows = self._query("SELECT update_time FROM assets WHERE id = ?", (parent,))
+        update_time = rows[0][0] if rows else None
+        if (
+            force
+            or listing is None
+            or listing[0] < time.time() - self.max_age
+            or (update_time is not None and update_time != listing[1])
+        ):
+            assets = self.lister(parent)
+            self._store_listing(parent, assets, update_time)
+            return assets is not None
+        return not listing[2]
+
+    def get(self, asset_id: str) -> Optional[dict]:
+        asset_id = asset_id.strip("/")
+        if asset_id in self.roots:
+            return {"id": asset_id, "type": FOLDER, "updateTime": None}
+        if not self._ensure_listed(self._parent(asset_id)):
+            return None
+        rows = self._query(
+            "SELECT id, type, update_time FROM assets WHERE id = ?", (asset_id,)
+        )
+        return self._as_asset(rows[0]) if rows else None
+
+    def exists(self, asset_id: str) -> bool:
+        return self.get(asset_id) is not None
+
+    def list(self, parent: str) -> Optional[List[dict]]:
+        parent = parent.strip("/")
+        if not self._ensure_listed(parent):
+            return None
+        rows = self._query(
+            "SELECT id, type, update_time FROM assets WHERE parent = ? ORDER BY id",
+            (parent,),
+        )
+        return [self._as_asset(r) for r in rows]
+
+    def add(self, asset_id: str, asset_type: str):
+        asset_id = asset_id.strip("/")
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO assets VALUES (?, ?, ?, NULL)",
+                (asset_id, self._parent(asset_id), asset_type),
+            )
+            if asset_type in CONTAINER_TYPES:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO listings VALUES (?, ?, NULL, 0)",
+                    (asset_id, time.time()),
+                )
+
+    @staticmethod
+    def _descendants(column, asset_id):
+        # prefix range instead of LIKE, which would treat `_` in asset names as a wildcard
+        return f"({column} >= ? AND {column} < ?)", (f"{asset_id}/", f"{asset_id}0")
+
+    def remove(self, asset_id: str):
+        asset_id = asset_id.strip("/")
+        with self._lock, self._db:
+            for table, column in [("assets", "id"), ("listings", "parent")]:
+                clause, params = self._descendants(column, asset_id)
+                self._db.execute(
+                    f"DELETE FROM {table} WHERE {column} = ? OR {clause}",
+                    (asset_id, *params),
+                )
+
+    def move(self, old_asset_id: str, new_asset_id: str):
+        old_asset_id = old_asset_id.strip("/")
+        new_asset_id = new_asset_id.strip("/")
+        start = len(old_asset_id) + 1
+        with self._lock:
+            self.remove(new_asset_id)
+            with self._db:
+                self._db.execute(
+                    "UPDATE assets SET id = ?, parent = ? WHERE id = ?",
+                    (new_asset_id, self._parent(new_asset_id), old_asset_id),
+                )
+                for table, column in [
+                    ("assets", "id"),
+                    ("assets", "parent"),
+                    ("listings", "parent"),
+                ]:
+                    clause, params = self._descendants(column, old_asset_id)
+                    self._db.execute(
+                        f"UPDATE {table} SET {column} = ? || substr({column}, ?) "
+                        f"WHERE {column} = ? OR {clause}",
+                        (new_asset_id, start, old_asset_id, *params),
+                    )
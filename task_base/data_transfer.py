@@ -1,28 +1,75 @@
-import re
-import subprocess
+import base64
+import hashlib
+import math
+import os
 import ee
-from google.cloud.exceptions import NotFound
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 
 class ConversionException(Exception):
     pass
 
 
+class TransferException(Exception):
+    pass
+
+
+# deferred until needed: importing google.cloud is a large part of task_base's import time
+def _not_found():
+    from google.cloud.exceptions import NotFound
+
+    return NotFound
+
+
 class DataTransferMixin(object):
     DEFAULT_BUCKET = "scl-pipeline"
+    # files larger than this are transferred as concurrent chunks
+    transfer_chunk_size = 64 * 1024 * 1024
+    transfer_max_workers = 8
+    GCS_MAX_COMPOSE = 32  # source objects per compose request
+    GCS_MAX_BATCH = 100  # requests per batch request
+    _gcs_buckets = None
 
-    def _parse_task_id(self, output: Union[str, bytes]) -> Optional[str]:
-        text = output.decode("utf-8") if isinstance(output, bytes) is True else output
-        task_id_regex = re.compile(r"(?<=ID: ).*", flags=re.IGNORECASE)
-        try:
-            matches = task_id_regex.search(text)
-            if matches is None:
-                return None
-            return matches[0]
-        except TypeError:
-            return None
+    # Bucket handles are created once without the metadata request `get_bucket` makes. The first call
+    # also widens the client's HTTP connection pool to match `transfer_max_workers`.
+    def _get_bucket(self, bucketname: str):
+        if self._gcs_buckets is None:
+            from requests.adapters import HTTPAdapter
+
+            pool_size = max(self.transfer_max_workers, 10)
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self.gcsclient._http.mount("https://", adapter)
+            self._gcs_buckets = {}
+        if bucketname not in self._gcs_buckets:
+            self._gcs_buckets[bucketname] = self.gcsclient.bucket(bucketname)
+        return self._gcs_buckets[bucketname]
+
+    def _md5(self, local_path: Union[str, Path]) -> str:
+        md5 = hashlib.md5()
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(8 * 1024 * 1024), b""):
+                md5.update(chunk)
+        return base64.b64encode(md5.digest()).decode("utf-8")
+
+    # composite objects have no md5, so fall back to crc32c
+    def _unchanged(self, local_path: Path, blob) -> bool:
+        if blob is None or blob.size != local_path.stat().st_size:
+            return False
+        if blob.md5_hash:
+            return blob.md5_hash == self._md5(local_path)
+        return blob.crc32c == self._crc32c(local_path)
+
+    def _crc32c(self, local_path: Union[str, Path]) -> str:
+        import google_crc32c
+
+        checksum = google_crc32c.Checksum()
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(8 * 1024 * 1024), b""):
+                checksum.update(chunk)
+        return base64.b64encode(checksum.digest()).decode("utf-8")
 
     def upload_to_cloudstorage(
         self,
@@ -31,101 +78,292 @@ class DataTransferMixin(object):
         bucketname: Optional[str] = None
     ) -> str:
         bucketname = bucketname or self.DEFAULT_BUCKET
-        bucket = self.gcsclient.get_bucket(bucketname)
+        bucket = self._get_bucket(bucketname)
         blob = bucket.blob(str(blob_path))
-        blob.upload_from_filename(str(local_path), timeout=3600)
+        size = os.path.getsize(local_path)
+        if size <= self.transfer_chunk_size:
+            blob.upload_from_filename(str(local_path), timeout=3600)
+        else:
+            self._upload_composite(bucket, blob, local_path, size)
         return f"gs://{bucketname}/{blob_path}"
 
+    # Upload byte ranges of local_path as temporary part objects in parallel, compose them into `blob`
+    # and check the composite's crc32c against the local file.
+    def _upload_composite(self, bucket, blob, local_path, size):
+        chunk_size = max(
+            self.transfer_chunk_size, math.ceil(size / self.GCS_MAX_COMPOSE)
+        )
+        offsets = range(0, size, chunk_size)
+        parts = [bucket.blob(f"{blob.name}.part-{i:02d}") for i in range(len(offsets))]
+
+        def _delete_part(part):
+            try:
+                part.delete()
+            except _not_found():
+                pass
+
+        def _upload_part(i):
+            with open(local_path, "rb") as f:
+                f.seek(offsets[i])
+                length = min(chunk_size, size - offsets[i])
+                parts[i].upload_from_file(f, size=length, timeout=3600)
+
+        with ThreadPoolExecutor(max_workers=self.transfer_max_workers) as pool:
+            local_crc32c = pool.submit(self._crc32c, local_path)
+            try:
+                list(pool.map(_upload_part, range(len(parts))))
+                blob.compose(parts, timeout=3600)
+            finally:
+                list(pool.map(_delete_part, parts))
+
+            blob.reload()
+            if blob.crc32c != local_crc32c.result():
+                blob.delete()
+                raise TransferException(f"crc32c mismatch uploading {local_path}")
+
     def download_from_cloudstorage(
         self, blob_path: Union[str, Path], local_path: Union[str, Path], bucketname: Optional[str] = None
     ) -> str:
         bucketname = bucketname or self.DEFAULT_BUCKET
-        bucket = self.gcsclient.get_bucket(bucketname)
-        blob = bucket.blob(str(blob_path))
-        blob.download_to_filename(str(local_path))
+        bucket = self._get_bucket(bucketname)
+        blob = bucket.get_blob(str(blob_path))
+        if blob is None:
+            raise _not_found()(f"gs://{bucketname}/{blob_path}")
+        if blob.size <= self.transfer_chunk_size:
+            blob.download_to_filename(str(local_path))
+        else:
+            self._download_ranges(blob, local_path)
         return local_path
 
+    # Read byte ranges of `blob` in parallel into a preallocated local file and verify its crc32c
+    def _download_ranges(self, blob, local_path):
+        with open(local_path, "wb") as f:
+            f.truncate(blob.size)
+
+        fd = os.open(local_path, os.O_WRONLY)
+        try:
+
+            def _download_range(start):
+                end = min(start + self.transfer_chunk_size, blob.size) - 1
+                os.pwrite(fd, blob.download_as_bytes(start=start, end=end), start)
+
+            with ThreadPoolExecutor(max_workers=self.transfer_max_workers) as pool:
+                list(
+                    pool.map(
+                        _download_range, range(0, blob.size, self.transfer_chunk_size)
+                    )
+                )
+        finally:
+            os.close(fd)
+
+        if blob.crc32c and self._crc32c(local_path) != blob.crc32c:
+            os.remove(local_path)
+            raise TransferException(f"crc32c mismatch downloading {blob.name}")
+
     def remove_from_cloudstorage(
         self, blob_path: str, bucketname: Optional[str] = None
     ):
         bucketname = bucketname or self.DEFAULT_BUCKET
-        bucket = self.gcsclient.get_bucket(bucketname)
+        bucket = self._get_bucket(bucketname)
         try:  # don't fail entire task if this fails
             bucket.delete_blob(blob_path)
-        except NotFound:
+        except _not_found():
             print(f"{blob_path} not found")
 
+    def bulk_remove_from_cloudstorage(
+        self, blob_paths: List[str], bucketname: Optional[str] = None
+    ):
+        bucket = self._get_bucket(bucketname or self.DEFAULT_BUCKET)
+        blob_paths = [str(b) for b in blob_paths]
+        for i in range(0, len(blob_paths), self.GCS_MAX_BATCH):
+            try:  # don't fail entire task if this fails
+                with self.gcsclient.batch():
+                    for blob_path in blob_paths[i : i + self.GCS_MAX_BATCH]:
+                        bucket.delete_blob(blob_path)
+            except _not_found() as e:
+                print(f"not all blobs found: {e}")
+
+    # Upload every file under local_dir to blob_prefix, skipping files whose size and checksum match the
+    # existing blob. With `delete`, blobs under blob_prefix with no local counterpart are removed.
+    # Returns the uploaded blob paths.
+    def sync_to_cloudstorage(
+        self,
+        local_dir: Union[str, Path],
+        blob_prefix: str,
+        bucketname: Optional[str] = None,
+        delete: bool = False,
+    ) -> List[str]:
+        bucketname = bucketname or self.DEFAULT_BUCKET
+        local_dir = Path(local_dir)
+        blob_prefix = blob_prefix.strip("/")
+        blobs = {
+            b.name: b
+            for b in self.gcsclient.list_blobs(
+                self._get_bucket(bucketname), prefix=f"{blob_prefix}/"
+            )
+        }
+        local_paths = {
+            f"{blob_prefix}/{p.relative_to(local_dir).as_posix()}": p
+            for p in local_dir.rglob("*")
+            if p.is_file()
+        }
+
+        def _sync(blob_path):
+            if self._unchanged(local_paths[blob_path], blobs.get(blob_path)):
+                return None
+            self.upload_to_cloudstorage(local_paths[blob_path], blob_path, bucketname)
+            return blob_path
+
+        with ThreadPoolExecutor(max_workers=self.transfer_max_workers) as pool:
+            uploaded = [b for b in pool.map(_sync, local_paths) if b]
+        if delete:
+            self.bulk_remove_from_cloudstorage(
+                [b for b in blobs if b not in local_paths], bucketname
+            )
+        return uploaded
+
+    # Download every blob under blob_prefix into local_dir, skipping files that already match. With
+    # `delete`, local files with no blob counterpart are removed. Returns the downloaded local paths.
+    def sync_from_cloudstorage(
+        self,
+        blob_prefix: str,
+        local_dir: Union[str, Path],
+        bucketname: Optional[str] = None,
+        delete: bool = False,
+    ) -> List[Path]:
+        bucketname = bucketname or self.DEFAULT_BUCKET
+        local_dir = Path(local_dir)
+        blob_prefix = blob_prefix.strip("/")
+        blobs = {
+            local_dir / b.name[len(blob_prefix) + 1 :]: b
+            for b in self.gcsclient.list_blobs(
+                self._get_bucket(bucketname), prefix=f"{blob_prefix}/"
+            )
+            if not b.name.endswith("/")
+        }
+
+        def _sync(local_path):
+            blob = blobs[local_path]
+            if local_path.exists() and self._unchanged(local_path, blob):
+                return None
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            self.download_from_cloudstorage(blob.name, local_path, bucketname)
+            return local_path
+
+        with ThreadPoolExecutor(max_workers=self.transfer_max_workers) as pool:
+            downloaded = [p for p in pool.map(_sync, blobs) if p]
+        if delete and local_dir.exists():
+            for local_path in local_dir.rglob("*"):
+                if local_path.is_file() and local_path not in blobs:
+                    local_path.unlink()
+        return downloaded
+
+    def _start_ingestion(self, manifest: dict, table: bool = False) -> str:
+        request_id = ee.data.newTaskId()[0]
+        try:
+            if table:
+                response = ee.data.startTableIngestion(request_id, manifest)
+            else:
+                response = ee.data.startIngestion(request_id, manifest)
+        except ee.ee_exception.EEException as err:
+            raise ConversionException(str(err))
+        task_id = response.get("id")
+        if task_id is None:
+            raise TypeError("task_id is None")
+        return task_id
+
     def storage2image(
         self, blob_uri: str, image_asset_id: str, nodataval: Optional[int] = None
     ) -> str:
-        try:
-            cmd_args = [
-                "/usr/local/bin/earthengine",
-                f"--service_account_file={self.google_creds_path}",
-                "upload image",
-                f"--asset_id={image_asset_id}",
-            ]
-            if nodataval:
-                cmd_args.append(f"--nodata_value={nodataval}")
-            cmd = cmd_args + [blob_uri]
-            output = subprocess.check_output(
-                " ".join(cmd), stderr=subprocess.STDOUT, shell=True
-            )
-            task_id = self._parse_task_id(output)
-            if task_id is None:
-                raise TypeError("task_id is None")
-            self.ee_tasks[task_id] = {}
-            return task_id
-        except subprocess.CalledProcessError as err:
-            raise ConversionException(err.stdout)
+        manifest = {
+            "name": self._ee_asset_name(image_asset_id),
+            "tilesets": [{"sources": [{"uris": [blob_uri]}]}],
+        }
+        if nodataval:
+            manifest["missingData"] = {"values": [nodataval]}
+        task_id = self._start_ingestion(manifest)
+        self._register_ee_task(
+            task_id, "ingestion", destination=image_asset_id, asset_type="IMAGE"
+        )
+        return task_id
 
     def storage2table(
         self, blob_uri: str, table_asset_id: str, geometry_column: Optional[str] = None
     ) -> str:
-        try:
-            cmd_args = [
-                "/usr/local/bin/earthengine",
-                f"--service_account_file={self.google_creds_path}",
-                "upload table",
-                f"--asset_id={table_asset_id}",
-            ]
-            if geometry_column:
-                cmd_args.append(f"--primary_geometry_column {geometry_column}")
-
-            cmd = cmd_args + [blob_uri]
-            output = subprocess.check_output(
-                " ".join(cmd), stderr=subprocess.STDOUT, shell=True
+        source = {"uris": [blob_uri]}
+        if geometry_column:
+            source["primaryGeometryColumn"] = geometry_column
+        manifest = {"name": self._ee_asset_name(table_asset_id), "sources": [source]}
+        task_id = self._start_ingestion(manifest, table=True)
+        self._register_ee_task(
+            task_id, "ingestion", destination=table_asset_id, asset_type="TABLE"
+        )
+        return task_id
+
+    # Ingest many blobs into one ImageCollection. Each item is a dict with `uri`, `date` (date or
+    # "YYYY-mm-dd", used for system:time_start) and optionally `properties` and `name` (asset name within
+    # the collection; defaults to the blob's file name without extension). Returns the ee task ids.
+    def storage2imagecollection(
+        self,
+        items: List[dict],
+        collection_asset_id: str,
+        nodataval: Optional[int] = None,
+    ) -> List[str]:
+        collection_asset_id = collection_asset_id.strip("/")
+        self._ensure_asset_tree(collection_asset_id, image_collection=True)
+
+        manifests = []
+        for item in items:
+            itemdate = item["date"]
+            if isinstance(itemdate, str):
+                itemdate = datetime.strptime(itemdate, self.DATE_FORMAT)
+            name = item.get("name") or Path(item["uri"]).stem
+            manifest = {
+                "name": self._ee_asset_name(f"{collection_asset_id}/{name}"),
+                "tilesets": [{"sources": [{"uris": [item["uri"]]}]}],
+                "startTime": itemdate.strftime("%Y-%m-%dT00:00:00Z"),
+            }
+            if item.get("properties"):
+                manifest["properties"] = item["properties"]
+            if nodataval:
+                manifest["missingData"] = {"values": [nodataval]}
+            manifests.append((f"{collection_asset_id}/{name}", manifest))
+
+        task_ids, errors = self._map_concurrent(
+            lambda i: self._start_ingestion(manifests[i][1]), range(len(manifests))
+        )
+        for i, task_id in sorted(task_ids.items()):
+            self._register_ee_task(
+                task_id, "ingestion", destination=manifests[i][0], asset_type="IMAGE"
+            )
+        if errors:
+            raise ConversionException(
+                "; ".join(f"{manifests[i][0]}: {e}" for i, e in sorted(errors.items()))
             )
-            task_id = self._parse_task_id(output)
-            if task_id is None:
-                raise TypeError("task_id is None")
-            self.ee_tasks[task_id] = {}
-            return task_id
-        except subprocess.CalledProcessError as err:
-            raise ConversionException(err.stdout)
-
-    def image2storage(self, image, bucket, asset_path, region=None):
+        return [task_ids[i] for i in sorted(task_ids)]
+
+    def image2storage(self, image, bucket, asset_path, region=None, priority=0):
         image = self.set_export_metadata(image)
         blob = asset_path.split("/")[-1]
-        region = region or self.extent
-        if isinstance(region, list):
-            region = ee.Geometry.Polygon(region, proj=self.crs, geodesic=False)
-
-        image_export = ee.batch.Export.image.toCloudStorage(
-            image=image,
-            description=blob,
-            bucket=bucket,
-            fileNamePrefix=asset_path,
-            region=region,
-            fileFormat="GeoTIFF",
-            formatOptions={"cloudOptimized": True},
-            scale=self.scale,
-            crs=self.crs,
-            maxPixels=self.ee_max_pixels,
+        region = self._export_region(region)
+
+        def _image_export():
+            return ee.batch.Export.image.toCloudStorage(
+                image=image,
+                description=blob,
+                bucket=bucket,
+                fileNamePrefix=asset_path,
+                region=region,
+                fileFormat="GeoTIFF",
+                formatOptions={"cloudOptimized": True},
+                scale=self.scale,
+                crs=self.crs,
+                maxPixels=self.ee_max_pixels,
+            )
+
+        return self._queue_export(
+            _image_export, "image2storage", blob, f"gs://{bucket}/{asset_path}", priority
         )
-        image_export.start()
-        self.ee_tasks[image_export.id] = {}
-        return image_export.id
 
     def table2storage(
         self,
@@ -134,20 +372,23 @@ class DataTransferMixin(object):
         asset_path,
         file_format="GeoJSON",
         selectors=None,
+        priority=0,
     ):
         featurecollection = self.set_export_metadata(
             featurecollection, ee_type=self.FEATURECOLLECTION
         )
         blob = asset_path.split("/")[-1]
 
-        fc_export = ee.batch.Export.table.toCloudStorage(
-            featurecollection,
-            description=blob,
-            bucket=bucket,
-            fileNamePrefix=asset_path,
-            fileFormat=file_format,
-            selectors=selectors,
+        def _fc_export():
+            return ee.batch.Export.table.toCloudStorage(
+                featurecollection,
+                description=blob,
+                bucket=bucket,
+                fileNamePrefix=asset_path,
+                fileFormat=file_format,
+                selectors=selectors,
+            )
+
+        return self._queue_export(
+            _fc_export, "table2storage", blob, f"gs://{bucket}/{asset_path}", priority
         )
-        fc_export.start()
-        self.ee_tasks[fc_export.id] = {}
-        return fc_export.id
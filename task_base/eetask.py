@@ -1,14 +1,23 @@
 import os
+import bisect
+import hashlib
+import heapq
 import json
+import math
 import re
-import subprocess
+import tempfile
+import threading
 import time
+import uuid
 import ee
-import git
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
-from google.cloud.storage import Client
 from pathlib import Path
+from .asset_catalog import AssetCatalog
 from .geotask import GeoTask
+from .journal import TransactionJournal
+from .task_records import EETaskRecord
+from .task_status import TaskStatusCoordinator
 from .data_transfer import DataTransferMixin
 
 
@@ -29,9 +38,42 @@ class EETask(GeoTask, DataTransferMixin):
     google_creds_path = "/.google_creds"
     ee_project = None
     ee_rootdir = None
-    ee_tasks = {}
-    _failed_ee_tasks = {}
     ee_max_pixels = 10000000000000
+    ee_max_workers = 8
+    ee_max_concurrent_exports = None  # None: start every export immediately
+    ee_tile_retries = 2
+    ee_poll_min = 10
+    ee_poll_max = 600
+    ee_status_chunk_size = 50  # task ids per getTaskStatus request
+    # directory shared by processes that should poll task statuses through one coordinator
+    ee_status_dir = os.environ.get("EE_STATUS_DIR")
+    ee_status_interval = float(os.environ.get("EE_STATUS_INTERVAL") or 30)
+    # overwrite commits are journaled here; mount it to recover from a commit interrupted partway
+    ee_journal_dir = os.environ.get("EE_JOURNAL_DIR") or "/.ee_journals"
+    # simplified aoi geometries, keyed by asset id and updateTime
+    ee_geometry_cache_dir = os.environ.get("EE_GEOMETRY_CACHE") or "/.ee_geometries"
+    aoi_max_error = 1000  # meters the cached aoi geometry may deviate from the source asset
+    aoi_geometry = None
+    # export with the simplified aoi geometry instead of its bounding box when no region is given
+    export_tight_region = False
+    asset_catalog_path = os.environ.get("ASSET_CATALOG") or "/.asset_catalog.sqlite"
+    asset_catalog_roots = [f"{PROJECTS}/SCL/v1", f"{PROJECTS}/HII/v1"]
+    asset_catalog_max_age = float(os.environ.get("ASSET_CATALOG_MAX_AGE") or 86400)
+    # process-wide memo of asset paths known to exist, shared by all instances
+    _known_ee_paths = set()
+    _known_ee_paths_lock = threading.Lock()
+    # asset id -> version suffixes handed out in this process, so concurrent exports never collide
+    _reserved_assetids = {}
+    _reserved_assetids_lock = threading.Lock()
+    # eedir -> dated FeatureCollection index, see `_fc_index`
+    _fc_indexes = {}
+    _fc_indexes_lock = threading.Lock()
+    # process-wide ee session, credentials, GCS client and asset catalogs, shared by all instances
+    _ee_session = None  # the service account key (or "persistent") ee was initialized with
+    _gcs_credentials_ready = False
+    _gcs_client = None
+    _asset_catalogs = {}
+    _clients_lock = threading.RLock()
 
     EEREADY = "READY"
     EE = "RUNNING"
@@ -47,112 +89,312 @@ class EETask(GeoTask, DataTransferMixin):
     EEDIR = "Folder"
     FEATURECOLLECTION = "FeatureCollection"
     EEDATATYPES = [IMAGECOLLECTION, IMAGE, EEDIR, FEATURECOLLECTION]
+    TILESET_PROPERTY = "tileset"
 
     def _canonicalize_assetid(self, assetid):
         path_segments = [s.replace(" ", "_") for s in assetid.split("/")]
         assetid = "/".join(path_segments)
-        new_assetid = assetid
-        if ee.data.getInfo(assetid):
-            i = 1
-            while ee.data.getInfo(new_assetid):
-                new_assetid = f"{assetid}-{i}"
-                i += 1
+        parent = "/".join(path_segments[:-1])
+        version_regex = re.compile(rf"^{re.escape(assetid)}(?:-(\d+))?$")
+
+        # one listing of the parent gives every existing version; 0 stands for the unsuffixed name
+        versions = set()
+        for asset in self._list_assets(parent) or []:
+            match = version_regex.match(asset["id"])
+            if match:
+                versions.add(int(match.group(1) or 0))
+
+        with self._reserved_assetids_lock:
+            versions.update(self._reserved_assetids.get(assetid, set()))
+            version = 0
+            if 0 in versions:
+                version = 1
+                while version in versions:
+                    version += 1
+            self._reserved_assetids.setdefault(assetid, set()).add(version)
+        new_assetid = f"{assetid}-{version}" if version else assetid
 
         if self.overwrite and assetid != new_assetid:
             self.transaction_assets.append((assetid, new_assetid))
 
         return new_assetid
 
-    def _prep_asset_id(self, asset_path, image_collection=False, pathdate=None):
-        asset_path = f"{self.ee_rootdir}/{asset_path}"
-        asset_name = asset_path.split("/")[-1]
-        pathdate = pathdate or self.taskdate
+    def _forget_fc_index(self, asset_id):
+        with self._fc_indexes_lock:
+            self._fc_indexes.pop(asset_id.rsplit("/", 1)[0], None)
+
+    def _forget_ee_path(self, asset_id):
+        self._forget_fc_index(asset_id)
+        with self._known_ee_paths_lock:
+            self._known_ee_paths.difference_update(
+                [
+                    p
+                    for p in self._known_ee_paths
+                    if p == asset_id or p.startswith(f"{asset_id}/")
+                ]
+            )
 
+    def _path_exists(self, path):
+        with self._known_ee_paths_lock:
+            if path in self._known_ee_paths:
+                return True
+        if self._get_asset(path):
+            with self._known_ee_paths_lock:
+                self._known_ee_paths.add(path)
+            return True
+        return False
+
+    # Create whatever part of `asset_path` does not exist yet. Existence is monotonic along the path, so
+    # the deepest existing ancestor is found by bisecting over path depth.
+    def _ensure_asset_tree(self, asset_path, image_collection=False):
         path_segments = asset_path.split("/")
         # first two segments are user/project root (e.g. projects/HII)
-        path_length = len(path_segments)
-        for i in range(2, path_length):
-            path = "/".join(path_segments[: i + 1])
-            if ee.data.getInfo(path):
-                continue
-            if i == path_length - 1 and image_collection:
-                ee.data.createAsset({"type": "ImageCollection"}, opt_path=path)
+        paths = ["/".join(path_segments[: i + 1]) for i in range(2, len(path_segments))]
+        lo, hi = 0, len(paths)  # paths[:lo] exist, paths[hi:] do not
+        with self._known_ee_paths_lock:
+            while lo < hi and paths[lo] in self._known_ee_paths:
+                lo += 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._path_exists(paths[mid]):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        for i in range(lo, len(paths)):
+            path = paths[i]
+            if i == len(paths) - 1 and image_collection:
+                asset_type = "IMAGE_COLLECTION"
+                ee_type = self.IMAGECOLLECTION
             else:
-                ee.data.createAsset({"type": "Folder"}, opt_path=path)
+                asset_type = "FOLDER"
+                ee_type = self.EEDIR
+            try:
+                ee.data.createAsset({"type": ee_type}, opt_path=path)
+            except ee.ee_exception.EEException:
+                # may have been created concurrently by another export
+                if not ee.data.getInfo(path):
+                    raise
+            self._catalog_add(path, asset_type)
+            with self._known_ee_paths_lock:
+                self._known_ee_paths.add(path)
+
+    def _prep_asset_id(
+        self, asset_path, image_collection=False, pathdate=None, suffix=""
+    ):
+        asset_path = f"{self.ee_rootdir}/{asset_path}"
+        asset_name = asset_path.split("/")[-1]
+        pathdate = pathdate or self.taskdate
+
+        self._ensure_asset_tree(asset_path, image_collection)
 
         asset_id = self._canonicalize_assetid(
-            f"{asset_path}/{asset_name}_{pathdate}"
+            f"{asset_path}/{asset_name}_{pathdate}{suffix}"
         )
         return asset_name, asset_id
 
     def _initialize_ee_client(self):
-        if self.service_account_key is None:
-            ee.Initialize("persistent")
-        else:
-            service_account_name = json.loads(self.service_account_key)["client_email"]
-            credentials = ee.ServiceAccountCredentials(
-                service_account_name, key_data=self.service_account_key
-            )
-            ee.Initialize(credentials)
+        session = self.service_account_key or "persistent"
+        with EETask._clients_lock:
+            if EETask._ee_session == session:
+                return
+            if self.service_account_key is None:
+                ee.Initialize("persistent")
+            else:
+                service_account_name = json.loads(self.service_account_key)["client_email"]
+                credentials = ee.ServiceAccountCredentials(
+                    service_account_name, key_data=self.service_account_key
+                )
+                ee.Initialize(credentials)
+            EETask._ee_session = session
+
+    def _prepare_gcs_credentials(self):
+        with EETask._clients_lock:
+            if EETask._gcs_credentials_ready:
+                return
+            creds_path = Path(self.google_creds_path)
+            if creds_path.exists() is False and self.service_account_key:
+                with open(creds_path, "w") as f:
+                    f.write(self.service_account_key)
+            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.google_creds_path
+            EETask._gcs_credentials_ready = True
+
+    # created on first use; google.cloud.storage is slow to import and not every task touches GCS
+    @property
+    def gcsclient(self):
+        with EETask._clients_lock:
+            if EETask._gcs_client is None:
+                from google.cloud.storage import Client
+
+                self._prepare_gcs_credentials()
+                EETask._gcs_client = Client()
+            return EETask._gcs_client
+
+    def _get_asset_catalog(self):
+        key = (self.asset_catalog_path, tuple(self.asset_catalog_roots))
+        with EETask._clients_lock:
+            if key not in EETask._asset_catalogs:
+                catalog = AssetCatalog(
+                    self.asset_catalog_path,
+                    self.asset_catalog_roots,
+                    self._fetch_assets,
+                    self.asset_catalog_max_age,
+                )
+                EETask._asset_catalogs[key] = catalog
+            return EETask._asset_catalogs[key]
 
-    def _list_assets(self, eedir):
-        assets = None
-        # possible ee api bug requires prepending
-        assetdir = f"{PROJECTS}/earthengine-legacy/assets/{eedir}"
+    # possible ee api bug requires prepending
+    def _ee_asset_name(self, asset_id):
+        return f"{PROJECTS}/earthengine-legacy/assets/{asset_id}"
+
+    def _fetch_assets(self, eedir):
+        assets = []
+        params = {"parent": self._ee_asset_name(eedir)}
         try:
-            assets = ee.data.listAssets({"parent": assetdir})["assets"]
+            while True:
+                response = ee.data.listAssets(params)
+                assets += response.get("assets", [])
+                if not response.get("nextPageToken"):
+                    return assets
+                params["pageToken"] = response["nextPageToken"]
         except ee.ee_exception.EEException:
+            return None
+
+    def _list_assets(self, eedir):
+        if self.asset_catalog.covers(eedir):
+            assets = self.asset_catalog.list(eedir)
+        else:
+            assets = self._fetch_assets(eedir)
+        if assets is None:
             print(f"Folder {eedir} does not exist or is not a folder.")
         return assets
 
+    # answers existence/type queries for the catalogued project trees locally
+    def _get_asset(self, asset_id):
+        if self.asset_catalog.covers(asset_id):
+            return self.asset_catalog.get(asset_id)
+        if asset_id not in self._ee_asset_info:
+            self._ee_asset_info[asset_id] = ee.data.getInfo(asset_id)
+        return self._ee_asset_info[asset_id]
+
+    # Run `func` over `items` on a bounded thread pool; returns ({item: result}, {item: exception})
+    def _map_concurrent(self, func, items):
+        items = list(dict.fromkeys(items))
+        results = {}
+        errors = {}
+        if not items:
+            return results, errors
+        with ThreadPoolExecutor(max_workers=min(self.ee_max_workers, len(items))) as pool:
+            futures = {item: pool.submit(func, item) for item in items}
+            for item, future in futures.items():
+                try:
+                    results[item] = future.result()
+                except Exception as e:
+                    errors[item] = e
+        return results, errors
+
+    # warm the catalog / getInfo cache for many paths at once
+    def prefetch_assets(self, asset_ids):
+        return self._map_concurrent(self._get_asset, asset_ids)
+
+    def _catalog_add(self, asset_id, asset_type):
+        self._forget_fc_index(asset_id)
+        if self.asset_catalog.covers(asset_id):
+            self.asset_catalog.add(asset_id, asset_type)
+        else:
+            self._ee_asset_info.pop(asset_id, None)
+
+    def _is_ee_container(self, asset_type):
+        return asset_type in [
+            ee.data.ASSET_TYPE_FOLDER,
+            ee.data.ASSET_TYPE_IMAGE_COLL,
+            ee.data.ASSET_TYPE_FOLDER_CLOUD,
+            ee.data.ASSET_TYPE_IMAGE_COLL_CLOUD,
+        ]
+
+    def _delete_ee(self, asset_id):
+        ee.data.deleteAsset(asset_id)
+        self.asset_catalog.remove(asset_id)
+        self._forget_ee_path(asset_id)
+        self._ee_asset_info.pop(asset_id, None)
+
     def _rm_ee(self, asset_id, dry_run=False):
-        asset = ee.data.getInfo(asset_id)
+        asset = self._get_asset(asset_id)
         if not asset:
             print(f"{asset_id} does not exist")
             return False
 
-        asset_type = asset["type"].capitalize()
-        cmd_args = [
-            "earthengine",
-            f"--service_account_file {self.google_creds_path}",
-            "rm",
-        ]
-        if dry_run:
-            cmd_args.append("--dry_run")
-
-        if (
-            asset_type == ee.data.ASSET_TYPE_FOLDER
-            or asset_type == ee.data.ASSET_TYPE_IMAGE_COLL
-            or asset_type == ee.data.ASSET_TYPE_FOLDER_CLOUD
-            or asset_type == ee.data.ASSET_TYPE_IMAGE_COLL_CLOUD
-        ):
-            cmd_args.append("-r")
-        cmd_args.append(asset_id)
+        # folders/collections are deleted recursively, one level at a time from the deepest, with each
+        # level listed and deleted concurrently
+        levels = [[(asset_id, asset["type"])]]
+        while True:
+            containers = [i for i, t in levels[-1] if self._is_ee_container(t)]
+            listings, _ = self._map_concurrent(self._list_assets, containers)
+            children = [
+                (a["id"], a["type"]) for assets in listings.values() for a in assets or []
+            ]
+            if not children:
+                break
+            levels.append(children)
 
-        subprocess.run(" ".join(cmd_args), stderr=subprocess.STDOUT, shell=True)
+        for level in reversed(levels):
+            asset_ids = [i for i, _ in level]
+            if dry_run:
+                for i in asset_ids:
+                    print(f"{i} would be deleted")
+                continue
+            _, errors = self._map_concurrent(self._delete_ee, asset_ids)
+            if errors:
+                for i, e in errors.items():
+                    print(f"Could not delete {i}: {e}")
+                return False
         return True
 
     def _mv_ee(self, old_assetid, new_assetid):
-        old_asset = ee.data.getInfo(old_assetid)
+        old_asset = self._get_asset(old_assetid)
         if not old_asset:
             print(f"{old_assetid} does not exist")
             return False
-        new_asset = ee.data.getInfo(new_assetid)
+        new_asset = self._get_asset(new_assetid)
         if new_asset:
             print(f"{new_assetid} already exists")
             return False
 
-        cmd_args = [
-            "earthengine",
-            f"--service_account_file {self.google_creds_path}",
-            "mv",
-            old_assetid,
-            new_assetid,
-        ]
-        subprocess.run(" ".join(cmd_args), stderr=subprocess.STDOUT, shell=True)
+        try:
+            ee.data.renameAsset(old_assetid, new_assetid)
+        except ee.ee_exception.EEException as e:
+            print(f"Could not move {old_assetid} to {new_assetid}: {e}")
+            return False
+        if self.asset_catalog.covers(new_assetid):
+            self.asset_catalog.move(old_assetid, new_assetid)
+        else:
+            self.asset_catalog.remove(old_assetid)
+        self._forget_ee_path(old_assetid)
+        self._forget_fc_index(new_assetid)
+        self._ee_asset_info.pop(old_assetid, None)
+        self._ee_asset_info.pop(new_assetid, None)
 
         return True
 
+    # concurrent `_rm_ee` / `_mv_ee` over many assets; return {asset id or (old, new): success}
+    def _rm_ee_many(self, asset_ids, dry_run=False):
+        results, errors = self._map_concurrent(
+            lambda i: self._rm_ee(i, dry_run), asset_ids
+        )
+        for i, e in errors.items():
+            print(f"Could not delete {i}: {e}")
+            results[i] = False
+        return results
+
+    def _mv_ee_many(self, asset_id_pairs):
+        results, errors = self._map_concurrent(
+            lambda pair: self._mv_ee(*pair), asset_id_pairs
+        )
+        for pair, e in errors.items():
+            print(f"Could not move {pair[0]} to {pair[1]}: {e}")
+            results[pair] = False
+        return results
+
     def __init__(self, *args, **kwargs):
         self._initialize_ee_client()
 
@@ -166,16 +408,61 @@ class EETask(GeoTask, DataTransferMixin):
         self.ee_rootdir = self.ee_rootdir.strip("/")
 
         self.transaction_assets = []
+        self.ee_tasks = {}
+        self._failed_ee_tasks = {}
+        self.ee_task_records = {}
+        self._ee_task_assets = {}  # task id -> (asset id, asset type) it writes
+        self._export_queue = []
+        self._ee_exports = {}
+        self._export_seq = 0
+        max_exports = kwargs.get("ee_max_concurrent_exports") or os.environ.get(
+            "ee_max_concurrent_exports"
+        )
+        if max_exports:
+            self.ee_max_concurrent_exports = int(max_exports)
+        self.ee_task_report = kwargs.get("ee_task_report") or os.environ.get(
+            "ee_task_report"
+        )
+        self.export_tight_region = (
+            kwargs.get("export_tight_region")
+            or os.environ.get("export_tight_region")
+            or self.export_tight_region
+        )
+        self._ee_asset_info = {}
+        self._export_metadata = None
+        self._ee_task_runtimes = []
+        self.task_status_coordinator = None
+        if self.ee_status_dir:
+            self.task_status_coordinator = TaskStatusCoordinator(
+                self.ee_status_dir, self._get_task_statuses, self.ee_status_interval
+            )
+        self.ee_max_workers = int(
+            kwargs.get("ee_max_workers")
+            or os.environ.get("ee_max_workers")
+            or self.ee_max_workers
+        )
 
-        creds_path = Path(self.google_creds_path)
-        if creds_path.exists() is False:
-            with open(creds_path, "w") as f:
-                f.write(self.service_account_key)
-        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = self.google_creds_path
-        self.gcsclient = Client()
+        self.asset_catalog = self._get_asset_catalog()
+        self._prepare_gcs_credentials()
 
         super().__init__(*args, **kwargs)
 
+        self.journal_recovery = (
+            kwargs.get("journal_recovery")
+            or os.environ.get("journal_recovery")
+            or "replay"
+        )
+        journal_name = "__".join(
+            [
+                type(self).__name__,
+                self.ee_rootdir.replace("/", "__"),
+                self.taskdate.strftime(self.DATE_FORMAT),
+            ]
+        )
+        self.journal = TransactionJournal(Path(self.ee_journal_dir) / f"{journal_name}.json")
+        if self.journal.exists():
+            self._recover_journal()
+
     def rm_ee(self, asset_path, dry_run=False):
         asset_path = f"{self.ee_rootdir}/{asset_path}"
         return self._rm_ee(asset_path, dry_run)
@@ -192,19 +479,60 @@ class EETask(GeoTask, DataTransferMixin):
     #         return
     #     ee.data.copyAsset(source_id, destination_id, overwrite)
     #
-    def set_aoi_from_ee(self, asset):
+    def _aoi_cache_path(self, asset):
+        info = self._get_asset(asset)
+        if not info or not info.get("updateTime"):
+            return None
+        key = f"{asset}@{info['updateTime']}@{self.crs}@{self.aoi_max_error}"
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return Path(self.ee_geometry_cache_dir) / f"{digest}.json"
+
+    def _write_aoi_cache(self, cache_path, aoi):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path.parent, delete=False, suffix=".tmp"
+            ) as f:
+                json.dump(aoi, f, separators=(",", ":"))
+            os.replace(f.name, cache_path)
+        except OSError as e:
+            print(f"Could not cache aoi geometry in {cache_path}: {e}")
+
+    # bounds and simplified geometry of `asset` in one request
+    def _fetch_aoi(self, asset):
         try:  # setting aoi from FeatureCollection
             ee_aoi = ee.Geometry.MultiPolygon(
                 ee.FeatureCollection(asset).geometry().coordinates(),
                 proj=self.crs,
                 geodesic=False,
             )
-            # TODO: refactor so that aoi is actual multipolygon, not bounds().
-            #  Currently without bounds, getInfo()["coordinates"] is too big a payload.
-            self.aoi = self.extent = ee_aoi.bounds().getInfo()["coordinates"]
+            return ee.Dictionary(
+                {
+                    "bounds": ee_aoi.bounds().coordinates(),
+                    "geometry": ee_aoi.simplify(maxError=self.aoi_max_error),
+                }
+            ).getInfo()
         except ee.ee_exception.EEException:  # setting aoi from Image
-            ee_aoi = ee.Image(asset)
-            self.aoi = self.extent = ee_aoi.geometry().bounds().getInfo()["coordinates"]
+            ee_aoi = ee.Image(asset).geometry()
+            return ee.Dictionary(
+                {"bounds": ee_aoi.bounds().coordinates(), "geometry": ee_aoi}
+            ).getInfo()
+
+    # self.aoi/self.extent are the bounds of `asset`; self.aoi_geometry is its (simplified) geometry as
+    # GeoJSON, cached locally until the asset changes
+    def set_aoi_from_ee(self, asset):
+        try:
+            cache_path = self._aoi_cache_path(asset)
+            aoi = None
+            if cache_path and cache_path.exists():
+                with open(cache_path) as f:
+                    aoi = json.load(f)
+            if aoi is None:
+                aoi = self._fetch_aoi(asset)
+                if cache_path:
+                    self._write_aoi_cache(cache_path, aoi)
+            self.aoi = self.extent = aoi["bounds"]
+            self.aoi_geometry = aoi["geometry"]
         except Exception as e:
             self.status = self.FAILED
             raise type(e)(
@@ -212,77 +540,171 @@ class EETask(GeoTask, DataTransferMixin):
                 + " `set_aoi_from_ee` asset is neither a FeatureCollection nor an Image path"
             ) from e
 
+    # ee.Geometry to export with: `region` if given, otherwise the aoi geometry or the task extent
+    def _export_region(self, region=None):
+        if region is None and self.export_tight_region and self.aoi_geometry:
+            return ee.Geometry(self.aoi_geometry)
+        region = region or self.extent
+        if isinstance(region, list):
+            region = ee.Geometry.Polygon(region, proj=self.crs, geodesic=False)
+        return region
+
+    # client-side bounding boxes of the aoi geometry's polygons, to skip tiles that miss all of them
+    def _aoi_part_bounds(self):
+        geometry = self.aoi_geometry
+        polygons = geometry.get("coordinates") or []
+        if geometry.get("type") == "Polygon":
+            polygons = [polygons]
+        part_bounds = []
+        for polygon in polygons:
+            xs = [p[0] for ring in polygon for p in ring]
+            ys = [p[1] for ring in polygon for p in ring]
+            part_bounds.append((min(xs), min(ys), max(xs), max(ys)))
+        return part_bounds
+
     # All inputs MUST have `system:time_start` set
-    def get_most_recent_image(self, imagecollection):
+    def _most_recent_ee(self, imagecollection):
         # ensure date max filter uses 24-hour period of self.taskdate
         filterdate = self.taskdate + timedelta(days=1)
         filterdate = ee.Date(filterdate.strftime(self.DATE_FORMAT))
-        most_recent_image = (
+        return (
             imagecollection.filterDate("1900-01-01", filterdate)
             .sort(self.ASSET_TIMESTAMP_PROPERTY, False)
-            .first()
+            .limit(1)
         )
-        return_image = None
-        most_recent_date = None
-        if most_recent_image.getInfo():
-            return_image = most_recent_image
-            system_timestamp = most_recent_image.get(
-                self.ASSET_TIMESTAMP_PROPERTY
-            ).getInfo()
-            if system_timestamp:
-                most_recent_date = ee.Date(system_timestamp)
-        return return_image, most_recent_date
+
+    # Timestamp and tileset of the most recent image of each collection, fetched together in one
+    # small payload instead of the full image metadata. Each item is a dict with `time_start` and
+    # `tileset`, or None if the collection has no image on or before taskdate. Collections may be
+    # computed, so images are rebuilt from the collection rather than loaded by `system:id`.
+    def _most_recent_image_info(self, imagecollections):
+        payload = ee.List(
+            [
+                ee.Dictionary(
+                    {
+                        "time_start": latest.aggregate_array(
+                            self.ASSET_TIMESTAMP_PROPERTY
+                        ),
+                        "tileset": latest.aggregate_array(self.TILESET_PROPERTY),
+                    }
+                )
+                for latest in [self._most_recent_ee(ic) for ic in imagecollections]
+            ]
+        ).getInfo()
+        return [
+            {
+                "time_start": p["time_start"][0],
+                "tileset": (p["tileset"] or [None])[0],
+            }
+            if p["time_start"]
+            else None
+            for p in payload
+        ]
+
+    # tiles written by a tiled `export_image_ee`, reassembled into one image
+    def _tileset_image(self, imagecollection, tileset):
+        tiles = imagecollection.filter(ee.Filter.eq(self.TILESET_PROPERTY, tileset))
+        first = ee.Image(tiles.first())
+        return ee.Image(
+            tiles.mosaic()
+            .setDefaultProjection(first.projection())
+            .copyProperties(first, first.propertyNames())
+        )
+
+    def get_most_recent_images(self, imagecollections):
+        imagecollections = list(imagecollections)
+        return [
+            self._most_recent_from_info(ic, info)
+            for ic, info in zip(
+                imagecollections, self._most_recent_image_info(imagecollections)
+            )
+        ]
+
+    # (image, ee.Date) for one `_most_recent_image_info` entry, without further requests
+    def _most_recent_from_info(self, imagecollection, info):
+        if info is None:
+            return None, None
+        if info["tileset"]:
+            return (
+                self._tileset_image(imagecollection, info["tileset"]),
+                ee.Date(info["time_start"]),
+            )
+        return self._most_recent_ee(imagecollection).first(), ee.Date(info["time_start"])
+
+    def get_most_recent_image(self, imagecollection):
+        return self.get_most_recent_images([imagecollection])[0]
 
     def get_most_recent_fullyear_imagecollection(
         self, imagecollection, maxage, filterdate=None, iteration=1
     ):
         filterdate = filterdate or self.taskdate + timedelta(days=1)
-        previousyear_start = date(filterdate.year - 1, 1, 1)
-        previousyear_end = date(filterdate.year - 1, 12, 31)
-        most_recent_ic = imagecollection.filterDate(
-            previousyear_start.strftime(self.DATE_FORMAT),
-            previousyear_end.strftime(self.DATE_FORMAT),
-        )
-        images = most_recent_ic.getInfo()["features"]
-        if len(images) > 0:
-            return most_recent_ic, ee.Date(
-                previousyear_start.strftime(self.DATE_FORMAT)
+        # full years before filterdate, most recent first, checked with one distinct-years aggregate
+        # a fractional maxage (e.g. 2.5) also covers the partly included year
+        window = max(1, math.ceil(maxage) - iteration + 1)
+        years = [filterdate.year - i for i in range(1, window + 1)]
+        available_years = (
+            imagecollection.filterDate(
+                date(years[-1], 1, 1).strftime(self.DATE_FORMAT),
+                date(years[0] + 1, 1, 1).strftime(self.DATE_FORMAT),
             )
+            .aggregate_array(self.ASSET_TIMESTAMP_PROPERTY)
+            .map(lambda t: ee.Date(t).get("year"))
+            .distinct()
+            .getInfo()
+        )
 
-        if iteration < maxage:
-            return self.get_most_recent_fullyear_imagecollection(
-                imagecollection, maxage, previousyear_start, iteration + 1
-            )
+        for year in years:
+            if year in available_years:
+                year_start = date(year, 1, 1).strftime(self.DATE_FORMAT)
+                most_recent_ic = imagecollection.filterDate(
+                    year_start, date(year + 1, 1, 1).strftime(self.DATE_FORMAT)
+                )
+                return most_recent_ic, ee.Date(year_start)
 
         return None, None
 
+    # Sorted [((date, version), asset id)] of the dated tables in eedir, built from one paginated listing
+    # and kept for the rest of the process
+    def _fc_index(self, eedir):
+        with self._fc_indexes_lock:
+            if eedir in self._fc_indexes:
+                return self._fc_indexes[eedir]
+
+        assets = self._list_assets(eedir)
+        if assets is None:
+            return None
+        index = []
+        for asset in assets:
+            if asset["type"] != "TABLE":
+                continue
+            match = re.search(r"(\d{4}-\d{2}-\d{2})(?:-(\d+))?", asset["id"])
+            if not match:
+                continue
+            try:
+                fcdate = datetime.strptime(match.group(1), self.DATE_FORMAT).date()
+            except ValueError:
+                continue
+            index.append(((fcdate, int(match.group(2) or 0)), asset["id"]))
+        index.sort()
+
+        with self._fc_indexes_lock:
+            self._fc_indexes[eedir] = index
+        return index
+
     # only use on fcs with SCL naming convention ending in `YYYY-mm-dd`
     def get_most_recent_featurecollection(self, eedir):
-        most_recent_fc = None
-        most_recent_date = None
-        most_recent_version = 0
-        if not ee.data.getInfo(eedir):
+        index = self._fc_index(eedir)
+        if not index:
             return None, None
-        assets = self._list_assets(eedir)
-
-        for asset in assets:
-            if asset["type"] == "TABLE":
-                match = re.search(r"(\d{4}-\d{2}-\d{2})(-\d*)*", asset["id"])
-                if match:
-                    fcdate = datetime.strptime(match.group(1), self.DATE_FORMAT).date()
-                    version = None
-                    if match.group(2):
-                        version = int(match.group(2)[1:])
-                    if (
-                        not most_recent_fc or fcdate >= most_recent_date
-                    ) and fcdate <= self.taskdate:
-                        most_recent_fc = ee.FeatureCollection(asset["id"])
-                        most_recent_date = fcdate
-                        most_recent_version = version or 0
-
-        if most_recent_date is not None:
-            most_recent_date = ee.Date(most_recent_date.strftime(self.DATE_FORMAT))
-        return most_recent_fc, most_recent_date
+        # latest date (and highest version on that date) on or before taskdate
+        i = bisect.bisect_right(index, ((self.taskdate, math.inf),))
+        if i == 0:
+            return None, None
+        (fcdate, _), asset_id = index[i - 1]
+        return (
+            ee.FeatureCollection(asset_id),
+            ee.Date(fcdate.strftime(self.DATE_FORMAT)),
+        )
 
     def check_inputs(self):
         super().check_inputs()
@@ -296,6 +718,10 @@ class EETask(GeoTask, DataTransferMixin):
             self.status = self.FAILED
             raise type(e)(str(e) + " `aoi` incorrect: {}".format(self.aoi)) from e
 
+        assets, asset_errors = self.prefetch_assets(
+            i["ee_path"] for i in self.inputs.values() if "ee_path" in i
+        )
+        dated_inputs = {}
         for key, ee_input in self.inputs.items():
             if "ee_path" not in ee_input:  # not an EE input
                 continue
@@ -305,55 +731,92 @@ class EETask(GeoTask, DataTransferMixin):
                 print("Missing or invalid ee_type for {}".format(ee_input["ee_path"]))
                 continue
 
-            if not ee.data.getInfo(ee_input["ee_path"]):
+            if ee_input["ee_path"] in asset_errors:
+                self.status = self.FAILED
+                print(
+                    f"Could not get {ee_input['ee_path']}: {asset_errors[ee_input['ee_path']]}"
+                )
+                continue
+
+            if not assets[ee_input["ee_path"]]:
                 self.status = self.FAILED
                 print("{} does not exist".format(ee_input["ee_path"]))
                 continue
 
-            ee_taskdate = ee.Date(self.taskdate.strftime(self.DATE_FORMAT))
-            asset = None
-            asset_date = None
             # no abstract featureCollection maxage checking; implement in inheritor specific to input
             if (
                 ("static" in ee_input and ee_input["static"] is True)
                 or ee_input["ee_type"] == self.FEATURECOLLECTION
                 or ee_input["ee_type"] == self.EEDIR
             ):
-                asset_date = ee.Date(self.taskdate.strftime(self.DATE_FORMAT))
                 continue
-            else:
-                if ee_input["ee_type"] == self.IMAGE:
-                    asset = ee.Image(ee_input["ee_path"])
-                    system_timestamp = asset.get(
-                        self.ASSET_TIMESTAMP_PROPERTY
-                    ).getInfo()
-                    if system_timestamp:
-                        asset_date = ee.Date(system_timestamp)
-                if ee_input["ee_type"] == self.IMAGECOLLECTION:
-                    ic = ee.ImageCollection(ee_input["ee_path"])
-                    asset, asset_date = self.get_most_recent_image(ic)
-
-            if asset is None or asset.getInfo() is None or asset_date is None:
+            dated_inputs[key] = ee_input
+
+        input_ages = self._evaluate_input_ages(dated_inputs)
+        for key, ee_input in dated_inputs.items():
+            input_age = input_ages.get(key)
+            if input_age is None:
+                self.status = self.FAILED
+                continue
+            if not input_age["time_start"]:
                 self.status = self.FAILED
                 print(
                     f"Asset {ee_input['ee_path']} has no `{self.ASSET_TIMESTAMP_PROPERTY}` property, "
                     f"or has a date more recent than taskdate {self.taskdate}"
                 )
                 continue
-            else:
-                age = ee_taskdate.difference(asset_date, "year").getInfo()
-                if age < 0:
-                    self.status = self.FAILED
-                    print(
-                        f"Asset {ee_input['ee_path']} has a date more recent than taskdate {self.taskdate}"
-                    )
-                    continue
-                if "maxage" in ee_input and age > ee_input["maxage"]:
-                    self.status = self.FAILED
-                    print(
-                        f"Asset {ee_input['ee_path']} is {age} years old (maxage: {ee_input['maxage']})"
-                    )
-                    continue
+
+            age = input_age["age"][0]
+            if age < 0:
+                self.status = self.FAILED
+                print(
+                    f"Asset {ee_input['ee_path']} has a date more recent than taskdate {self.taskdate}"
+                )
+                continue
+            if "maxage" in ee_input and age > ee_input["maxage"]:
+                self.status = self.FAILED
+                print(
+                    f"Asset {ee_input['ee_path']} is {age} years old (maxage: {ee_input['maxage']})"
+                )
+                continue
+
+    # Server-side timestamp and age (in years) of an Image input or of the most recent image of an
+    # ImageCollection input. Both lists are empty if there is no dated image on or before taskdate.
+    def _input_age_ee(self, ee_input):
+        ee_taskdate = ee.Date(self.taskdate.strftime(self.DATE_FORMAT))
+        if ee_input["ee_type"] == self.IMAGE:
+            images = ee.ImageCollection([ee.Image(ee_input["ee_path"])]).filter(
+                ee.Filter.notNull([self.ASSET_TIMESTAMP_PROPERTY])
+            )
+        else:
+            images = self._most_recent_ee(ee.ImageCollection(ee_input["ee_path"]))
+        timestamps = images.aggregate_array(self.ASSET_TIMESTAMP_PROPERTY)
+        return ee.Dictionary(
+            {
+                "time_start": timestamps,
+                "age": timestamps.map(
+                    lambda t: ee_taskdate.difference(ee.Date(t), "year")
+                ),
+            }
+        )
+
+    def _evaluate_input_ages(self, ee_inputs):
+        if not ee_inputs:
+            return {}
+        try:
+            return ee.Dictionary(
+                {key: self._input_age_ee(i) for key, i in ee_inputs.items()}
+            ).getInfo()
+        except ee.ee_exception.EEException:
+            # isolate the input(s) that broke the batch
+            input_ages = {}
+            for key, ee_input in ee_inputs.items():
+                try:
+                    input_ages[key] = self._input_age_ee(ee_input).getInfo()
+                except ee.ee_exception.EEException as e:
+                    print(f"Could not evaluate {ee_input['ee_path']}: {e}")
+                    input_ages[key] = None
+            return input_ages
 
     def inner_join(self, primary, secondary, primary_field, secondary_field):
         def _flatten_fields(feat):
@@ -408,22 +871,37 @@ class EETask(GeoTask, DataTransferMixin):
                 return_properties[key] = propval
         return return_properties
 
-    def set_export_metadata(self, element, ee_type=IMAGE):
-        tasktime = time.strptime(
-            self.taskdate.strftime(self.DATE_FORMAT), self.DATE_FORMAT
-        )
-        epoch = int(time.mktime(tasktime) * 1000)
-        element = element.set(self.ASSET_TIMESTAMP_PROPERTY, epoch)
+    # call after changing `inputs`; a changed taskdate is picked up automatically
+    def reset_export_metadata(self):
+        self._export_metadata = None
 
+    def _git_sha(self):
         try:  # pass in `-v $PWD/.git:/app/.git` to docker command to write commit SHA to asset properties
+            import git
+
             repo = git.Repo(search_parent_directories=True)
-            sha = repo.head.object.hexsha
-            element = element.set("sha", sha)
+            return repo.head.object.hexsha
         except Exception as e:
-            pass
+            return None
+
+    # properties shared by every export of this task, computed once per taskdate
+    def export_metadata(self):
+        if self._export_metadata is None or self._export_metadata[0] != self.taskdate:
+            tasktime = time.strptime(
+                self.taskdate.strftime(self.DATE_FORMAT), self.DATE_FORMAT
+            )
+            epoch = int(time.mktime(tasktime) * 1000)
+            properties = {self.ASSET_TIMESTAMP_PROPERTY: epoch}
+            sha = self._git_sha()
+            if sha:
+                properties["sha"] = sha
+            properties.update(self.flatten_inputs())
+            self._export_metadata = (self.taskdate, properties)
+        return self._export_metadata[1]
 
+    def set_export_metadata(self, element, ee_type=IMAGE):
         # setMulti returns an Element, not an Image or FeatureCollection
-        element = element.setMulti(self.flatten_inputs())
+        element = element.setMulti(self.export_metadata())
         if ee_type == self.IMAGE:
             return ee.Image(element)
         elif ee_type == self.FEATURECOLLECTION:
@@ -436,84 +914,403 @@ class EETask(GeoTask, DataTransferMixin):
     #   get_most_recent_featurecollection uses date appended to name; check_inputs not implemented
 
     def export_image_ee(
-        self, image, asset_path, image_collection=True, region=None, pyramiding=None, pathdate=None
+        self,
+        image,
+        asset_path,
+        image_collection=True,
+        region=None,
+        pyramiding=None,
+        pathdate=None,
+        priority=0,
+        tiles=None,
     ):
         image = self.set_export_metadata(image)
-        image_name, asset_id = self._prep_asset_id(asset_path, image_collection, pathdate)
-        region = region or self.extent
-        if isinstance(region, list):
-            region = ee.Geometry.Polygon(region, proj=self.crs, geodesic=False)
         if pyramiding is None:
             pyramiding = {".default": "mean"}
+        if tiles:
+            return self._export_image_tiles(
+                image, asset_path, region, pyramiding, pathdate, priority, tiles
+            )
+
+        image_name, asset_id = self._prep_asset_id(asset_path, image_collection, pathdate)
+        region = self._export_region(region)
+
+        def _image_export():
+            return ee.batch.Export.image.toAsset(
+                image,
+                description=image_name,
+                assetId=asset_id,
+                region=region,
+                scale=self.scale,
+                crs=self.crs,
+                maxPixels=self.ee_max_pixels,
+                pyramidingPolicy=pyramiding,
+            )
 
-        image_export = ee.batch.Export.image.toAsset(
-            image,
-            description=image_name,
-            assetId=asset_id,
-            region=region,
-            scale=self.scale,
-            crs=self.crs,
-            maxPixels=self.ee_max_pixels,
-            pyramidingPolicy=pyramiding,
+        return self._queue_export(
+            _image_export,
+            "export_image_ee",
+            image_name,
+            asset_id,
+            priority,
+            asset_type="IMAGE",
         )
-        image_export.start()
-        self.ee_tasks[image_export.id] = {}
-        return image_export.id
 
-    def export_fc_ee(self, featurecollection, asset_path):
+    # Split `region` into a grid of `tiles` (n or (columns, rows)) whose edges fall on the crs/scale
+    # pixel grid. Returns [((row, column), [xmin, ymin, xmax, ymax])].
+    def _tile_regions(self, region, tiles):
+        columns, rows = (tiles, tiles) if isinstance(tiles, int) else tiles
+        if isinstance(region, list):
+            points = region
+            while isinstance(points[0][0], list):
+                points = [p for ring in points for p in ring]
+        else:
+            points = region.bounds(1, self.crs).coordinates().getInfo()[0]
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+
+        pixel = self.scale
+        if self.crs == "EPSG:4326":
+            pixel = self.scale / 111319.49079327357  # meters per degree at the equator
+        x0, x1 = math.floor(min(xs) / pixel), math.ceil(max(xs) / pixel)
+        y0, y1 = math.floor(min(ys) / pixel), math.ceil(max(ys) / pixel)
+        step_x = math.ceil((x1 - x0) / columns)
+        step_y = math.ceil((y1 - y0) / rows)
+
+        tile_regions = []
+        for row in range(rows):
+            for column in range(columns):
+                left = x0 + column * step_x
+                bottom = y0 + row * step_y
+                if left >= x1 or bottom >= y1:
+                    continue
+                coords = [
+                    left * pixel,
+                    bottom * pixel,
+                    min(left + step_x, x1) * pixel,
+                    min(bottom + step_y, y1) * pixel,
+                ]
+                tile_regions.append(((row, column), coords))
+        return tile_regions
+
+    # Export `image` as one asset per tile into the asset_path ImageCollection. Tiles share the layer's
+    # timestamp and a `tileset` property, so `get_most_recent_image` returns them as one mosaic.
+    # Failed tiles are retried on their own up to `ee_tile_retries` times.
+    def _export_image_tiles(
+        self, image, asset_path, region, pyramiding, pathdate, priority, tiles
+    ):
+        asset_name = f"{self.ee_rootdir}/{asset_path}".split("/")[-1]
+        # unique per export, so re-running a date without overwrite never mixes in the earlier tiles
+        tileset = f"{asset_name}_{pathdate or self.taskdate}_{uuid.uuid4().hex[:12]}"
+        image = ee.Image(image.set(self.TILESET_PROPERTY, tileset))
+        tight_region = None
+        if region is None and self.export_tight_region and self.aoi_geometry:
+            # tiles missing the aoi are skipped; the rest are exported clipped to it
+            tight_region = self._export_region()
+            part_bounds = self._aoi_part_bounds()
+            image = image.clip(tight_region)
+        task_ids = []
+        for (row, column), tile_coords in self._tile_regions(region or self.extent, tiles):
+            tile_x0, tile_y0, tile_x1, tile_y1 = tile_coords
+            if tight_region and not any(
+                b[0] < tile_x1 and b[2] > tile_x0 and b[1] < tile_y1 and b[3] > tile_y0
+                for b in part_bounds
+            ):
+                continue
+            tile_region = ee.Geometry.Rectangle(tile_coords, proj=self.crs, geodesic=False)
+            image_name, asset_id = self._prep_asset_id(
+                asset_path, True, pathdate, suffix=f"_tile{row}_{column}"
+            )
+            description = f"{image_name}_tile{row}_{column}"
+
+            def _tile_export(asset_id=asset_id, region=tile_region, description=description):
+                return ee.batch.Export.image.toAsset(
+                    image,
+                    description=description,
+                    assetId=asset_id,
+                    region=region,
+                    scale=self.scale,
+                    crs=self.crs,
+                    maxPixels=self.ee_max_pixels,
+                    pyramidingPolicy=pyramiding,
+                )
+
+            task_ids.append(
+                self._queue_export(
+                    _tile_export,
+                    "export_image_ee",
+                    description,
+                    asset_id,
+                    priority,
+                    retries=self.ee_tile_retries,
+                    asset_type="IMAGE",
+                )
+            )
+        return task_ids
+
+    def export_fc_ee(self, featurecollection, asset_path, priority=0):
         featurecollection = self.set_export_metadata(
             featurecollection, ee_type=self.FEATURECOLLECTION
         )
         # print(featurecollection.getInfo()["properties"])
         fc_name, asset_id = self._prep_asset_id(asset_path)
 
-        fc_export = ee.batch.Export.table.toAsset(
-            featurecollection, description=fc_name, assetId=asset_id
+        def _fc_export():
+            return ee.batch.Export.table.toAsset(
+                featurecollection, description=fc_name, assetId=asset_id
+            )
+
+        return self._queue_export(
+            _fc_export, "export_fc_ee", fc_name, asset_id, priority, asset_type="TABLE"
+        )
+
+    # Exports wait in a priority queue (higher first, FIFO within a priority) and are started while
+    # fewer than `ee_max_concurrent_exports` ee tasks are in flight. Returns the ee task id if the
+    # export started right away, otherwise None; queued exports are started by `update_ee_tasks`.
+    # `asset_type` is given for asset destinations, which are added to the catalog once written.
+    def _queue_export(
+        self,
+        make_export,
+        kind,
+        description,
+        destination=None,
+        priority=0,
+        retries=0,
+        asset_type=None,
+    ):
+        export = {
+            "make_export": make_export,
+            "kind": kind,
+            "description": description,
+            "destination": destination,
+            "asset_type": asset_type,
+            "priority": priority,
+            "retries": retries,
+            "task_id": None,
+        }
+        self._push_export(export)
+        self._start_queued_exports()
+        return export["task_id"]
+
+    def _push_export(self, export):
+        self._export_seq += 1
+        heapq.heappush(
+            self._export_queue, (-export["priority"], self._export_seq, export)
+        )
+
+    # requeue a failed export that still has retries left
+    def _retry_export(self, task_id):
+        export = self._ee_exports.pop(task_id, None)
+        if not export or export["retries"] < 1:
+            return False
+        export["retries"] -= 1
+        export["task_id"] = None
+        print(f"Retrying {export['description']} ({export['retries']} retries left)")
+        self._push_export(export)
+        return True
+
+    def _start_queued_exports(self):
+        started = 0
+        while self._export_queue and (
+            self.ee_max_concurrent_exports is None
+            or len(self.ee_tasks) < max(self.ee_max_concurrent_exports, 1)
+        ):
+            _, _, export = heapq.heappop(self._export_queue)
+            ee_export = export["make_export"]()
+            ee_export.start()
+            export["task_id"] = ee_export.id
+            self._ee_exports[ee_export.id] = export
+            self._register_ee_task(
+                ee_export.id,
+                export["kind"],
+                export["description"],
+                export["destination"],
+                export["asset_type"],
+            )
+            started += 1
+        return started
+
+    def _register_ee_task(
+        self, task_id, kind, description=None, destination=None, asset_type=None
+    ):
+        self.ee_tasks[task_id] = {}
+        if destination and asset_type:
+            self._ee_task_assets[task_id] = (destination, asset_type)
+        self.ee_task_records[task_id] = EETaskRecord(
+            task_id, kind, description=description, destination=destination
         )
-        fc_export.start()
-        self.ee_tasks[fc_export.id] = {}
-        return fc_export.id
 
     def wait(self):
         super().wait()
 
-        max_sleep = 600
-        counter = 3
+        sleeptime = self.ee_poll_min
         self._failed_ee_tasks = dict()
-        while self.ee_tasks:
-            self.update_ee_tasks()
-            if not self.ee_tasks:
+        while self.ee_tasks or self._export_queue:
+            changed = self.update_ee_tasks()
+            if not self.ee_tasks and not self._export_queue:
                 break
-            counter += 1
-            sleeptime = 2 ** counter
-            if sleeptime > max_sleep:
-                sleeptime = max_sleep
+            sleeptime = self._next_poll_interval(sleeptime, changed)
             time.sleep(sleeptime)
 
         if bool(self._failed_ee_tasks) is True:
             raise EETaskError(ee_statuses=self._failed_ee_tasks)
 
+    # Poll again soon after any state change; otherwise back off, but not past the point where a
+    # running task is expected to finish based on the runtimes of tasks completed so far.
+    def _next_poll_interval(self, previous, changed):
+        if changed:
+            return self.ee_poll_min
+        sleeptime = min(previous * 2, self.ee_poll_max)
+        if self._ee_task_runtimes:
+            runtimes = sorted(self._ee_task_runtimes)
+            expected = runtimes[len(runtimes) // 2]
+            now = time.time()
+            for s in self.ee_tasks.values():
+                if s.get("state") == self.EE and s.get("start_timestamp_ms"):
+                    remaining = expected - (now - s["start_timestamp_ms"] / 1000)
+                    if remaining > 0:
+                        sleeptime = min(sleeptime, max(remaining, self.ee_poll_min))
+        return sleeptime
+
+    def _get_task_statuses(self, task_ids):
+        statuses = []
+        for i in range(0, len(task_ids), self.ee_status_chunk_size):
+            statuses += ee.data.getTaskStatus(
+                task_ids[i : i + self.ee_status_chunk_size]
+            )
+        return statuses
+
+    # returns the number of tasks whose state changed since the previous poll
     def update_ee_tasks(self):
+        changed = 0
         if self.ee_tasks:
             try:
                 # possible ee task states: READY, RUNNING, COMPLETED, FAILED, CANCELLED, UNKNOWN
-                statuses = ee.data.getTaskStatus(self.ee_tasks.keys())
-                print(statuses)
+                if self.task_status_coordinator:
+                    statuses = self.task_status_coordinator.get_statuses(
+                        self.ee_tasks.keys()
+                    )
+                else:
+                    statuses = self._get_task_statuses(list(self.ee_tasks.keys()))
                 for s in statuses:
                     ee_task_state = s["state"]
                     ee_task_id = s["id"]
+                    if ee_task_id in self.ee_task_records:
+                        self.ee_task_records[ee_task_id].update(s)
+
+                    previous_state = self.ee_tasks.get(ee_task_id, {}).get("state")
+                    if ee_task_state != previous_state:
+                        changed += 1
+                        print(
+                            f"{s.get('description', ee_task_id)} ({ee_task_id}): "
+                            f"{previous_state or 'SUBMITTED'} -> {ee_task_state}"
+                        )
 
                     if ee_task_state in self.EEFINISHED:
                         if ee_task_state == self.EEFAILED:
-                            self._failed_ee_tasks[ee_task_id] = s
+                            print(s.get("error_message"))
+                            if not self._retry_export(ee_task_id):
+                                self._failed_ee_tasks[ee_task_id] = s
+                        elif s.get("start_timestamp_ms") and s.get("update_timestamp_ms"):
+                            self._ee_task_runtimes.append(
+                                (s["update_timestamp_ms"] - s["start_timestamp_ms"]) / 1000
+                            )
+                        # only assets that were actually written go into the catalog
+                        written = self._ee_task_assets.pop(ee_task_id, None)
+                        if written and ee_task_state in [self.EECOMPLETED, self.EESUCCEEDED]:
+                            self._catalog_add(*written)
                         del self.ee_tasks[ee_task_id]
+                        self._ee_exports.pop(ee_task_id, None)
                     else:
                         self.ee_tasks[s["id"]] = s
             except ConnectionResetError:
                 pass  # assume intermittent connectivity issue
+        changed += self._start_queued_exports()
+        if self.task_status_coordinator and not self.ee_tasks:
+            self.task_status_coordinator.register([])
+        return changed
+
+    def write_ee_task_report(self):
+        report = json.dumps(
+            {
+                "task": type(self).__name__,
+                "taskdate": self.taskdate.strftime(self.DATE_FORMAT),
+                "status": self.status,
+                "ee_tasks": [r.as_dict() for r in self.ee_task_records.values()],
+            }
+        )
+        if self.ee_task_report:
+            with open(self.ee_task_report, "w") as f:
+                f.write(report)
+        else:
+            print(f"ee task report: {report}")
+
+    # Replace `old` with `new`. Safe to repeat after an interruption at any point: what is left to do
+    # is decided from the journal state and from which of the two assets still exist.
+    def _swap_asset(self, swap):
+        if swap["state"] == TransactionJournal.PENDING:
+            if not self._get_asset(swap["new"]):  # never delete `old` without a replacement
+                print(f"{swap['new']} does not exist; leaving {swap['old']} in place")
+                return False
+            if self._get_asset(swap["old"]) and not self._rm_ee(swap["old"]):
+                return False
+            self.journal.set_state(swap, TransactionJournal.REMOVED)
+        if self._get_asset(swap["new"]):
+            if not self._mv_ee(swap["new"], swap["old"]):
+                return False
+        elif not self._get_asset(swap["old"]):
+            print(f"Neither {swap['old']} nor {swap['new']} exists")
+            return False
+        self.journal.set_state(swap, TransactionJournal.DONE)
+        return True
+
+    # undo a swap that has not touched `old` yet; swaps past that point can only be finished
+    def _rollback_swap(self, swap):
+        if swap["state"] != TransactionJournal.PENDING:
+            return self._swap_asset(swap)
+        if self._get_asset(swap["new"]) and not self._rm_ee(swap["new"]):
+            return False
+        self.journal.set_state(swap, TransactionJournal.DONE)
+        return True
+
+    def _run_journal(self, swap_func):
+        swaps = self.journal.unfinished()
+        results, errors = self._map_concurrent(
+            lambda i: swap_func(swaps[i]), range(len(swaps))
+        )
+        for i, e in errors.items():
+            print(f"Could not swap {swaps[i]['new']} into {swaps[i]['old']}: {e}")
+        if errors or not all(results.values()):
+            print(f"Unfinished asset swaps remain in {self.journal.path}")
+            return False
+        self.journal.finish()
+        return True
+
+    # waits for any other process that is committing or recovering the same journal
+    def _recover_journal(self):
+        with self.journal.locked():
+            if not self.journal.exists():  # finished by whoever held the lock
+                return
+            swaps = self.journal.load()
+            print(
+                f"Found unfinished overwrite commit in {self.journal.path} "
+                f"({len(self.journal.unfinished())}/{len(swaps)} swaps left); "
+                f"recovering with `{self.journal_recovery}`"
+            )
+            if self.journal_recovery == "rollback":
+                self._run_journal(self._rollback_swap)
+            else:
+                self._run_journal(self._swap_asset)
 
     def clean_up(self, **kwargs):
-        if self.status != self.FAILED and self.overwrite:
-            for old_assetid, new_assetid in self.transaction_assets:
-                self._rm_ee(old_assetid)
-                self._mv_ee(new_assetid, old_assetid)
+        committed = True
+        if self.status != self.FAILED and self.overwrite and self.transaction_assets:
+            with self.journal.locked():
+                self.journal.begin(self.transaction_assets)
+                committed = self._run_journal(self._swap_asset)
+            if not committed:
+                self.status = self.FAILED
+        if self.ee_task_records:
+            self.write_ee_task_report()
+        if not committed and self.raiseonfail:
+            raise RuntimeError(f"Overwrite commit incomplete; see {self.journal.path}")
@@ -1,4 +1,7 @@
 import ee
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from .eetask import EETask, PROJECTS
 
 
@@ -6,6 +9,7 @@ class HIITask(EETask):
     scale = 300
     ee_project = "HII/v1"
     _popdens_relative = "source/population_density"
+    popdens_export_priority = 10  # ahead of default-priority exports when it has to be recomputed
     common_inputs = {
         "countries": {
             "ee_type": EETask.FEATURECOLLECTION,
@@ -30,6 +34,9 @@ class HIITask(EETask):
     }
 
     def __init__(self, *args, **kwargs):
+        self._population_density = None
+        self._population_density_lock = threading.Lock()
+        self._popdens_export = None  # recomputed density still to be stored
         super().__init__(*args, **kwargs)
 
         self.countries = ee.FeatureCollection(
@@ -39,20 +46,38 @@ class HIITask(EETask):
 
     @property
     def population_density(self):
+        # resolved once per taskdate; check_inputs resolves it from a worker thread
+        with self._population_density_lock:
+            if (
+                self._population_density is None
+                or self._population_density[0] != self.taskdate
+            ):
+                self._population_density = (
+                    self.taskdate,
+                    self._resolve_population_density(),
+                )
+            return self._population_density[1]
+
+    def _resolve_population_density(self):
         # If population density for previous year has already been calculated and stored, use it
-        popdens = self.common_inputs["population_density"]["ee_path"]
-        population_density, _ = self.get_most_recent_image(ee.ImageCollection(popdens))
-        if population_density:
+        popdens = ee.ImageCollection(self.common_inputs["population_density"]["ee_path"])
+        info = self._most_recent_image_info([popdens])[0]
+        if info:
             taskyear = self.taskdate.year
-            popdensyear = _.get("year").getInfo()
+            popdensyear = datetime.fromtimestamp(
+                info["time_start"] / 1000, timezone.utc
+            ).year
             if (
                 0
                 <= (taskyear - popdensyear)
                 <= self.common_inputs["population_density"]["maxage"]
             ):
+                population_density, _ = self._most_recent_from_info(popdens, info)
                 return population_density
 
-        # Otherwise, calculate and store it before returning it
+        # Otherwise, calculate it and store it for later tasks. The export is only submitted by `wait`,
+        # i.e. once inputs checked out and calc succeeded, ahead of and alongside this task's own
+        # exports; this task uses the computed image directly.
         worldpop_ic, worldpop_date = self.get_most_recent_fullyear_imagecollection(
             ee.ImageCollection(self.common_inputs["worldpop"]["ee_path"]),
             self.common_inputs["worldpop"]["maxage"],
@@ -71,17 +96,26 @@ class HIITask(EETask):
                 .divide(area_km2)
                 .setDefaultProjection(self.crs, None, worldpop_scale)
             )
-            self.export_image_ee(population_density, self._popdens_relative)
-            self.wait()
-            saved_population_density, _ = self.get_most_recent_image(
-                ee.ImageCollection(popdens)
-            )
-            return saved_population_density
+            self._popdens_export = population_density
+            return population_density
 
         return None
 
     def check_inputs(self):
-        super().check_inputs()
-        if self.population_density is None:
+        # resolve population density alongside the generic input checks
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            population_density = pool.submit(lambda: self.population_density)
+            super().check_inputs()
+        if population_density.result() is None:
             self.status = self.FAILED
             print(f"Could not get population density for {self.taskdate}")
+
+    def wait(self):
+        if self._popdens_export is not None:
+            self.export_image_ee(
+                self._popdens_export,
+                self._popdens_relative,
+                priority=self.popdens_export_priority,
+            )
+            self._popdens_export = None
+        super().wait()
@@ -0,0 +1,77 @@
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Tuple, Union
+
+
+# On-disk record of the (old, new) asset swaps of an overwrite commit, so that a commit interrupted
+# partway can be finished or undone by the next run. Each swap moves through
+#   PENDING -> REMOVED (old asset deleted) -> DONE (new asset renamed to old)
+class TransactionJournal(object):
+    PENDING = "pending"
+    REMOVED = "removed"
+    DONE = "done"
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.swaps = []
+        self._lock = threading.Lock()
+
+    # exclusive across processes sharing the journal directory; hold it while committing or recovering
+    @contextmanager
+    def locked(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{self.path}.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> List[dict]:
+        with open(self.path) as f:
+            self.swaps = json.load(f)["swaps"]
+        return self.swaps
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump({"swaps": self.swaps}, f)
+        os.replace(f.name, self.path)
+
+    # swaps left unfinished by an earlier commit are kept and retried along with the new ones
+    def begin(self, asset_pairs: List[Tuple[str, str]]):
+        with self._lock:
+            if self.exists():
+                self.load()
+            swaps = self.unfinished()
+            pending = {(s["old"], s["new"]) for s in swaps}
+            swaps += [
+                {"old": old, "new": new, "state": self.PENDING}
+                for old, new in asset_pairs
+                if (old, new) not in pending
+            ]
+            self.swaps = swaps
+            self._save()
+
+    def set_state(self, swap: dict, state: str):
+        with self._lock:
+            swap["state"] = state
+            self._save()
+
+    def unfinished(self) -> List[dict]:
+        return [s for s in self.swaps if s["state"] != self.DONE]
+
+    def finish(self):
+        with self._lock:
+            self.swaps = []
+            self.path.unlink(missing_ok=True)
@@ -0,0 +1,157 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Type
+from .task import Task
+
+
+@dataclass
+class TaskTiming:
+    name: str
+    depends_on: List[str] = field(default_factory=list)
+    status: Optional[str] = None
+    started: Optional[float] = None  # seconds since the runner started
+    calc_started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0
+        return self.finished - self.started
+
+
+# Runs a graph of Task classes in one process. A task is constructed and run once everything it
+# depends on has finished `run()` -- i.e. its exports are complete and committed -- and independent
+# tasks run concurrently in threads, sharing the process-wide ee session, GCS client and asset catalog.
+# e.g. with placeholder task classes HIIPopulationDensity, HIIRoad and HIIAggregate from task repos:
+#   runner = TaskRunner(taskdate="2021-01-01")
+#   runner.add("popdens", HIIPopulationDensity)
+#   runner.add("roads", HIIRoad)
+#   runner.add("hii", HIIAggregate, depends_on=["popdens", "roads"])
+#   runner.run()
+class TaskRunner(object):
+    SKIPPED = "skipped"
+
+    def __init__(self, max_workers: int = 4, **common_kwargs):
+        self.max_workers = max_workers
+        self.common_kwargs = common_kwargs
+        self.tasks = {}
+        self.timings: Dict[str, TaskTiming] = {}
+        self._start = None
+
+    def add(self, name: str, task_class: Type[Task], depends_on: Sequence[str] = (), **kwargs):
+        if name in self.tasks:
+            raise ValueError(f"Task {name} already added")
+        self.tasks[name] = (task_class, list(depends_on), {**self.common_kwargs, **kwargs})
+
+    def _order(self) -> List[str]:
+        order = []
+        visiting = set()
+
+        def _visit(name, path):
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle: {' -> '.join(path + [name])}")
+            if name not in self.tasks:
+                raise ValueError(f"{path[-1]} depends on unknown task {name}")
+            visiting.add(name)
+            for dependency in self.tasks[name][1]:
+                _visit(dependency, path + [name])
+            visiting.remove(name)
+            order.append(name)
+
+        for name in self.tasks:
+            _visit(name, [])
+        return order
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def _run_task(self, name):
+        task_class, _, kwargs = self.tasks[name]
+        timing = self.timings[name]
+        timing.started = self._elapsed()
+        try:
+            task = task_class(**kwargs)
+            calc = task.calc
+
+            def _timed_calc():
+                timing.calc_started = self._elapsed()
+                return calc()
+
+            task.calc = _timed_calc
+            task.run()
+            timing.status = task.status
+        except Exception as e:
+            timing.status = Task.FAILED
+            timing.error = str(e)
+        finally:
+            timing.finished = self._elapsed()
+
+    def run(self) -> Dict[str, TaskTiming]:
+        order = self._order()
+        self._start = time.perf_counter()
+        self.timings = {n: TaskTiming(n, self.tasks[n][1]) for n in order}
+        pending = list(order)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                for name in list(pending):
+                    upstream = [self.timings[d].status for d in self.tasks[name][1]]
+                    if any(s is not None and s != Task.COMPLETE for s in upstream):
+                        self.timings[name].status = self.SKIPPED
+                        pending.remove(name)
+                    elif all(s == Task.COMPLETE for s in upstream):
+                        running[pool.submit(self._run_task, name)] = name
+                        pending.remove(name)
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        running.pop(future)
+
+        self.print_timeline()
+        failed = [n for n, t in self.timings.items() if t.status != Task.COMPLETE]
+        if failed:
+            raise RuntimeError(f"Tasks did not complete: {', '.join(failed)}")
+        return self.timings
+
+    # The chain of tasks that determined total runtime: from the task that finished last, back through
+    # whichever of its dependencies finished last.
+    def critical_path(self) -> List[TaskTiming]:
+        finished = [t for t in self.timings.values() if t.finished is not None]
+        if not finished:
+            return []
+        path = [max(finished, key=lambda t: t.finished)]
+        while True:
+            upstream = [self.timings[d] for d in path[-1].depends_on]
+            upstream = [t for t in upstream if t.finished is not None]
+            if not upstream:
+                break
+            path.append(max(upstream, key=lambda t: t.finished))
+        return list(reversed(path))
+
+    def print_timeline(self):
+        def _offset(seconds):
+            return "-" if seconds is None else f"{seconds:8.1f}s"
+
+        print(f"{'task':<30}{'status':>10}{'start':>10}{'calc':>10}{'end':>10}")
+        for timing in sorted(
+            self.timings.values(),
+            key=lambda t: (t.started is None, t.started or 0),
+        ):
+            print(
+                f"{timing.name:<30}{timing.status or '-':>10}{_offset(timing.started):>10}"
+                f"{_offset(timing.calc_started):>10}{_offset(timing.finished):>10}"
+            )
+            if timing.error:
+                print(f"  {timing.error}")
+
+        path = self.critical_path()
+        if path:
+            print(
+                f"critical path ({path[-1].finished:.1f}s): "
+                + " -> ".join(f"{t.name} ({t.duration:.1f}s)" for t in path)
+            )
@@ -1,5 +1,6 @@
 import ee
 import os
+from functools import cached_property
 from .eetask import EETask, PROJECTS
 
 
@@ -92,25 +93,45 @@ class SCLTask(EETask):
         ee_rootdir = "/".join(path_segments)
         super().__init__(*args, ee_rootdir=ee_rootdir, **kwargs)
 
-        self.historical_range_fc = ee.FeatureCollection(
-            self.common_inputs["historical_range"]["ee_path"]
+        aoi_path = f"{self.speciesdir}/{self.ee_aoi}"
+        self.prefetch_assets(
+            [aoi_path] + [i["ee_path"] for i in self.inputs.values() if "ee_path" in i]
         )
-        self.historical_range = self.historical_range_fc.reduceToImage(
+        self.set_aoi_from_ee(aoi_path)
+
+    # common inputs are built on first use, so tasks only pay for the ones their calc needs
+    @cached_property
+    def historical_range_fc(self):
+        return ee.FeatureCollection(self.common_inputs["historical_range"]["ee_path"])
+
+    @cached_property
+    def historical_range(self):
+        return self.historical_range_fc.reduceToImage(
             ["diss"], ee.Reducer.first()
         ).unmask(0)
-        self.countries = ee.FeatureCollection(
+
+    @cached_property
+    def countries(self):
+        return ee.FeatureCollection(
             self.common_inputs["countries"]["ee_path"]
         ).filterBounds(self.historical_range_fc.geometry())
-        self.ecoregions = ee.FeatureCollection(
+
+    @cached_property
+    def ecoregions(self):
+        return ee.FeatureCollection(
             self.common_inputs["ecoregions"]["ee_path"]
         ).filterBounds(self.historical_range_fc.geometry())
+
+    @cached_property
+    def pas(self):
         taskyear = ee.Date(self.taskdate.strftime(self.DATE_FORMAT)).get("year")
-        self.pas = (
+        return (
             ee.FeatureCollection(self.common_inputs["pas"]["ee_path"])
             .filterBounds(self.historical_range_fc.geometry())
             .filter(ee.Filter.neq("STATUS", "Proposed"))
             .filter(ee.Filter.lte("STATUS_YR", taskyear))
         )
-        self.watermask = ee.Image(self.common_inputs["watermask"]["ee_path"])
 
-        self.set_aoi_from_ee(f"{self.speciesdir}/{self.ee_aoi}")
+    @cached_property
+    def watermask(self):
+        return ee.Image(self.common_inputs["watermask"]["ee_path"])
@@ -1,3 +1,4 @@
+import copy
 import os
 from datetime import datetime, timezone
 
@@ -22,7 +23,9 @@ certain conditions; see https://www.gnu.org/licenses/#GPL for details.
     def _set_inputs(self, prop):
         if not hasattr(self, prop):
             return
-        inputs = getattr(self, prop)
+        # resolve into a per-instance copy; the class-level dict is shared by every instance
+        inputs = copy.deepcopy(getattr(self, prop))
+        setattr(self, prop, inputs)
         for input_key, i in inputs.items():
             for key, val in i.items():
                 if not isinstance(val, str) or not hasattr(self.__class__, val):
@@ -0,0 +1,37 @@
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+# Lifecycle timings of one ee export/ingestion task, kept after the task finishes for reporting
+@dataclass
+class EETaskRecord:
+    task_id: str
+    kind: str
+    description: Optional[str] = None
+    destination: Optional[str] = None
+    submitted_at: float = 0
+    ready_seconds: Optional[float] = None
+    running_seconds: Optional[float] = None
+    state: Optional[str] = None
+    eecu_seconds: Optional[float] = None
+
+    def __post_init__(self):
+        self.submitted_at = self.submitted_at or time.time()
+
+    def update(self, status: dict):
+        self.state = status.get("state", self.state)
+        self.description = self.description or status.get("description")
+        created = status.get("creation_timestamp_ms")
+        started = status.get("start_timestamp_ms")
+        updated = status.get("update_timestamp_ms")
+        if started:
+            created_at = created / 1000 if created else self.submitted_at
+            self.ready_seconds = max(started / 1000 - created_at, 0)
+            if updated:
+                self.running_seconds = max((updated - started) / 1000, 0)
+        if status.get("batch_eecu_usage_seconds") is not None:
+            self.eecu_seconds = status["batch_eecu_usage_seconds"]
+
+    def as_dict(self) -> dict:
+        return asdict(self)
@@ -0,0 +1,101 @@
+import fcntl
+import json
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Union
+
+
+# File-backed coordinator that lets every process sharing `directory` (e.g. containers with a common
+# volume) wait on ee tasks while only one of them polls `ee.data.getTaskStatus` per interval.
+#   registrations/<process>.json  task ids each process is waiting on, rewritten on every poll
+#   statuses.json                 last bulk poll result for the union of registered ids
+#   lease                         flock held by whichever process is currently polling
+class TaskStatusCoordinator(object):
+    STATUSES = "statuses.json"
+    LEASE = "lease"
+    REGISTRATIONS = "registrations"
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        fetch: Callable[[List[str]], List[dict]],
+        interval: float = 30,
+        expire_after: float = 3600,
+    ):
+        self.directory = Path(directory)
+        self.fetch = fetch
+        self.interval = interval
+        self.expire_after = expire_after
+        self.registration = (
+            self.directory / self.REGISTRATIONS / f"{os.getpid()}-{uuid.uuid4().hex}.json"
+        )
+        self.registration.parent.mkdir(parents=True, exist_ok=True)
+
+    def _write_json(self, path: Path, obj):
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump(obj, f)
+        os.replace(f.name, path)
+
+    def _read_json(self, path: Path, default):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return default
+
+    def register(self, task_ids: Iterable[str]):
+        task_ids = list(task_ids)
+        if task_ids:
+            self._write_json(self.registration, task_ids)
+        else:
+            self.registration.unlink(missing_ok=True)
+
+    def _registered_ids(self) -> List[str]:
+        # registrations not refreshed for a while belong to processes that died without cleaning up
+        expired = time.time() - self.expire_after
+        task_ids = set()
+        for registration in (self.directory / self.REGISTRATIONS).glob("*.json"):
+            try:
+                if registration.stat().st_mtime < expired:
+                    registration.unlink(missing_ok=True)
+                    continue
+            except FileNotFoundError:
+                continue
+            task_ids.update(self._read_json(registration, []))
+        return sorted(task_ids)
+
+    def _poll(self) -> dict:
+        cache = self._read_json(self.directory / self.STATUSES, {})
+        if cache.get("polled_at", 0) > time.time() - self.interval:
+            return cache
+
+        with open(self.directory / self.LEASE, "a") as lease:
+            try:
+                fcntl.flock(lease, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return cache  # another process is polling right now
+            try:
+                cache = self._read_json(self.directory / self.STATUSES, {})
+                if cache.get("polled_at", 0) > time.time() - self.interval:
+                    return cache
+                statuses = self.fetch(self._registered_ids())
+                cache = {
+                    "polled_at": time.time(),
+                    "statuses": {s["id"]: s for s in statuses},
+                }
+                self._write_json(self.directory / self.STATUSES, cache)
+                return cache
+            finally:
+                fcntl.flock(lease, fcntl.LOCK_UN)
+
+    # statuses for `task_ids` as of the latest bulk poll; ids not polled yet are omitted
+    def get_statuses(self, task_ids: Iterable[str]) -> List[dict]:
+        task_ids = list(task_ids)
+        self.register(task_ids)
+        statuses: Dict[str, dict] = self._poll().get("statuses", {})
+        return [statuses[i] for i in task_ids if i in statuses]
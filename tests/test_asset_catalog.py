@@ -0,0 +1,102 @@
+import time
+from task_base.asset_catalog import FOLDER, AssetCatalog
+
+
+class FakeLister(object):
+    def __init__(self, tree):
+        self.tree = tree
+        self.calls = []
+
+    def __call__(self, parent):
+        self.calls.append(parent)
+        if parent not in self.tree:
+            return None
+        return [dict(a) for a in self.tree[parent]]
+
+
+def asset(asset_id, asset_type="TABLE", update_time="1"):
+    return {"id": asset_id, "type": asset_type, "updateTime": update_time}
+
+
+def make_catalog(tmp_path, tree, max_age=86400):
+    lister = FakeLister(tree)
+    return AssetCatalog(str(tmp_path / "catalog.sqlite"), ["r"], lister, max_age), lister
+
+
+def underscore_tree():
+    return {
+        "r": [asset("r/a_b", FOLDER), asset("r/axb", FOLDER)],
+        "r/a_b": [asset("r/a_b/x")],
+        "r/axb": [asset("r/axb/y")],
+    }
+
+
+def test_remove_does_not_treat_underscore_as_wildcard(tmp_path):
+    catalog, _ = make_catalog(tmp_path, underscore_tree())
+    catalog.list("r")
+    assert catalog.exists("r/a_b/x") and catalog.exists("r/axb/y")
+
+    catalog.remove("r/a_b")
+    assert [a["id"] for a in catalog.list("r")] == ["r/axb"]
+    assert catalog.exists("r/axb/y")
+
+
+def test_move_renames_descendants_only(tmp_path):
+    catalog, lister = make_catalog(tmp_path, underscore_tree())
+    catalog.list("r")
+    catalog.list("r/a_b")
+    catalog.list("r/axb")
+
+    catalog.move("r/a_b", "r/c")
+    assert [a["id"] for a in catalog.list("r")] == ["r/axb", "r/c"]
+    assert [a["id"] for a in catalog.list("r/c")] == ["r/c/x"]
+    assert [a["id"] for a in catalog.list("r/axb")] == ["r/axb/y"]
+    assert "r/c" not in lister.calls  # moved listing is reused, not relisted
+
+
+def test_listing_is_reused_until_max_age(tmp_path):
+    tree = {"r": [asset("r/a")]}
+    catalog, lister = make_catalog(tmp_path, tree, max_age=0.2)
+    assert catalog.exists("r/a")
+
+    tree["r"].append(asset("r/b"))
+    assert not catalog.exists("r/b")
+    time.sleep(0.3)
+    assert catalog.exists("r/b")
+    assert lister.calls == ["r", "r"]
+
+
+def test_directory_is_relisted_when_its_update_time_changes(tmp_path):
+    tree = {"r": [asset("r/f", FOLDER, "1")], "r/f": [asset("r/f/a")]}
+    catalog, lister = make_catalog(tmp_path, tree, max_age=1)
+    catalog.list("r")
+    time.sleep(0.6)
+    assert catalog.exists("r/f/a")
+
+    tree["r"] = [asset("r/f", FOLDER, "2")]
+    tree["r/f"].append(asset("r/f/b"))
+    assert not catalog.exists("r/f/b")  # r/f's listing is fresh and r still reports time 1
+    time.sleep(0.5)
+    assert catalog.exists("r/f")  # r's listing has expired; r now reports time 2 for r/f
+    assert catalog.exists("r/f/b")  # r/f's listing is still fresh but out of date
+    assert lister.calls == ["r", "r/f", "r", "r/f"]
+
+
+def test_only_queried_directories_are_listed(tmp_path):
+    tree = {"r": [asset(f"r/d{i}", FOLDER) for i in range(5)]}
+    tree.update({f"r/d{i}": [asset(f"r/d{i}/a")] for i in range(5)})
+    catalog, lister = make_catalog(tmp_path, tree)
+
+    assert catalog.exists("r/d3/a")
+    assert lister.calls == ["r/d3"]
+
+
+def test_catalog_persists_between_instances(tmp_path):
+    tree = {"r": [asset("r/a")]}
+    catalog, _ = make_catalog(tmp_path, tree)
+    catalog.list("r")
+    catalog.add("r/new", "IMAGE")
+
+    reopened, lister = make_catalog(tmp_path, tree)
+    assert reopened.get("r/new")["type"] == "IMAGE"
+    assert lister.calls == []
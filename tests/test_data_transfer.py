@@ -0,0 +1,147 @@
+import base64
+import threading
+import pytest
+from task_base.data_transfer import DataTransferMixin, TransferException
+
+google_crc32c = pytest.importorskip("google_crc32c")
+
+
+def crc32c(data):
+    checksum = google_crc32c.Checksum()
+    checksum.update(data)
+    return base64.b64encode(checksum.digest()).decode("utf-8")
+
+
+# In-memory stand-ins for the google.cloud.storage Bucket/Blob calls DataTransferMixin makes
+class FakeBlob(object):
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.md5_hash = None
+        self.crc32c = None
+
+    @property
+    def data(self):
+        return self.bucket.objects[self.name]
+
+    @property
+    def size(self):
+        return len(self.data)
+
+    def upload_from_file(self, f, size=None, timeout=None):
+        self.bucket.store(self.name, f.read(size))
+
+    def upload_from_filename(self, filename, timeout=None):
+        with open(filename, "rb") as f:
+            self.upload_from_file(f)
+
+    def compose(self, sources, timeout=None):
+        self.bucket.compose_calls.append([s.name for s in sources])
+        self.bucket.store(self.name, b"".join(s.data for s in sources))
+
+    def reload(self):
+        self.crc32c = self.bucket.crc32c_override or crc32c(self.data)
+
+    def delete(self):
+        with self.bucket.lock:
+            self.bucket.objects.pop(self.name)
+
+    def download_as_bytes(self, start=None, end=None):
+        with self.bucket.lock:
+            self.bucket.range_calls.append((start, end))
+        return self.data[start : end + 1]
+
+    def download_to_filename(self, filename):
+        with open(filename, "wb") as f:
+            f.write(self.data)
+
+
+class FakeBucket(object):
+    def __init__(self):
+        self.objects = {}
+        self.compose_calls = []
+        self.range_calls = []
+        self.crc32c_override = None
+        self.lock = threading.Lock()
+
+    def store(self, name, data):
+        with self.lock:
+            self.objects[name] = data
+
+    def blob(self, name):
+        return FakeBlob(self, name)
+
+    def get_blob(self, name):
+        if name not in self.objects:
+            return None
+        blob = FakeBlob(self, name)
+        blob.reload()
+        return blob
+
+
+class Transfer(DataTransferMixin):
+    transfer_chunk_size = 10
+    transfer_max_workers = 4
+
+    def __init__(self, bucket):
+        self._gcs_buckets = {self.DEFAULT_BUCKET: bucket}
+
+
+DATA = bytes(range(256)) * 3 + b"tail"
+
+
+def test_large_upload_is_composed_from_parts(tmp_path):
+    bucket = FakeBucket()
+    local_path = tmp_path / "layer.tif"
+    local_path.write_bytes(DATA)
+
+    uri = Transfer(bucket).upload_to_cloudstorage(local_path, "dir/layer.tif")
+    assert uri == f"gs://{Transfer.DEFAULT_BUCKET}/dir/layer.tif"
+    assert bucket.objects == {"dir/layer.tif": DATA}  # parts cleaned up
+    # part size grows so that no more than GCS_MAX_COMPOSE parts are composed
+    assert len(bucket.compose_calls) == 1
+    assert 1 < len(bucket.compose_calls[0]) <= Transfer.GCS_MAX_COMPOSE
+
+
+def test_small_upload_is_not_composed(tmp_path):
+    bucket = FakeBucket()
+    local_path = tmp_path / "small.txt"
+    local_path.write_bytes(b"small")
+
+    Transfer(bucket).upload_to_cloudstorage(local_path, "small.txt")
+    assert bucket.objects == {"small.txt": b"small"}
+    assert bucket.compose_calls == []
+
+
+def test_upload_checksum_mismatch_removes_composite(tmp_path):
+    bucket = FakeBucket()
+    bucket.crc32c_override = crc32c(b"something else")
+    local_path = tmp_path / "layer.tif"
+    local_path.write_bytes(DATA)
+
+    with pytest.raises(TransferException):
+        Transfer(bucket).upload_to_cloudstorage(local_path, "layer.tif")
+    assert bucket.objects == {}
+
+
+def test_large_download_reads_ranges(tmp_path):
+    bucket = FakeBucket()
+    bucket.objects["layer.tif"] = DATA
+    local_path = tmp_path / "layer.tif"
+
+    Transfer(bucket).download_from_cloudstorage("layer.tif", local_path)
+    assert local_path.read_bytes() == DATA
+    starts = sorted(start for start, _ in bucket.range_calls)
+    assert starts == list(range(0, len(DATA), Transfer.transfer_chunk_size))
+    assert max(end for _, end in bucket.range_calls) == len(DATA) - 1
+
+
+def test_download_checksum_mismatch_removes_local_file(tmp_path):
+    bucket = FakeBucket()
+    bucket.objects["layer.tif"] = DATA
+    bucket.crc32c_override = crc32c(b"something else")
+    local_path = tmp_path / "layer.tif"
+
+    with pytest.raises(TransferException):
+        Transfer(bucket).download_from_cloudstorage("layer.tif", local_path)
+    assert not local_path.exists()
@@ -0,0 +1,105 @@
+import json
+from task_base.eetask import EETask
+from task_base.journal import TransactionJournal
+
+
+# EETask's swap/recovery logic over an in-memory set of asset ids; `fail_rm` makes deletes fail
+class FakeAssets(EETask):
+    ee_max_workers = 4
+    journal_recovery = "replay"
+
+    def __init__(self, journal, assets, fail_rm=()):
+        self.journal = journal
+        self.assets = set(assets)
+        self.fail_rm = set(fail_rm)
+
+    def _get_asset(self, asset_id):
+        return {"id": asset_id} if asset_id in self.assets else None
+
+    def _rm_ee(self, asset_id, dry_run=False):
+        if asset_id in self.fail_rm:
+            return False
+        self.assets.discard(asset_id)
+        return True
+
+    def _mv_ee(self, old_assetid, new_assetid):
+        self.assets.remove(old_assetid)
+        self.assets.add(new_assetid)
+        return True
+
+
+def saved_states(journal):
+    with open(journal.path) as f:
+        return [(s["old"], s["state"]) for s in json.load(f)["swaps"]]
+
+
+def test_begin_keeps_unfinished_swaps(tmp_path):
+    journal = TransactionJournal(tmp_path / "j.json")
+    journal.begin([("a", "a-1"), ("b", "b-1")])
+    journal.set_state(journal.swaps[0], TransactionJournal.DONE)
+    journal.set_state(journal.swaps[1], TransactionJournal.REMOVED)
+
+    reopened = TransactionJournal(tmp_path / "j.json")
+    reopened.begin([("b", "b-1"), ("c", "c-1")])
+    assert saved_states(reopened) == [
+        ("b", TransactionJournal.REMOVED),
+        ("c", TransactionJournal.PENDING),
+    ]
+
+
+def test_commit_swaps_and_removes_journal(tmp_path):
+    journal = TransactionJournal(tmp_path / "j.json")
+    task = FakeAssets(journal, {"a", "a-1", "b-1"})
+    journal.begin([("a", "a-1"), ("b", "b-1")])
+
+    assert task._run_journal(task._swap_asset)
+    assert task.assets == {"a", "b"}
+    assert not journal.exists()
+
+
+def test_failed_swap_stays_in_journal(tmp_path):
+    journal = TransactionJournal(tmp_path / "j.json")
+    task = FakeAssets(journal, {"a", "a-1", "b", "b-1"}, fail_rm={"b"})
+    journal.begin([("a", "a-1"), ("b", "b-1")])
+
+    assert not task._run_journal(task._swap_asset)
+    assert saved_states(journal) == [
+        ("a", TransactionJournal.DONE),
+        ("b", TransactionJournal.PENDING),
+    ]
+    assert task.assets == {"a", "b", "b-1"}
+
+
+def test_pending_swap_without_new_asset_keeps_old(tmp_path):
+    journal = TransactionJournal(tmp_path / "j.json")
+    task = FakeAssets(journal, {"a"})
+    journal.begin([("a", "a-1")])
+
+    assert not task._run_journal(task._swap_asset)
+    assert task.assets == {"a"}
+    assert saved_states(journal) == [("a", TransactionJournal.PENDING)]
+
+
+def test_replay_finishes_interrupted_commit(tmp_path):
+    journal = TransactionJournal(tmp_path / "j.json")
+    journal.begin([("a", "a-1"), ("b", "b-1"), ("c", "c-1")])
+    journal.set_state(journal.swaps[0], TransactionJournal.DONE)
+    journal.set_state(journal.swaps[1], TransactionJournal.REMOVED)
+    # interrupted after deleting c but before recording it
+    task = FakeAssets(TransactionJournal(journal.path), {"a", "b-1", "c-1"})
+
+    task._recover_journal()
+    assert task.assets == {"a", "b", "c"}
+    assert not journal.exists()
+
+
+def test_rollback_undoes_pending_and_finishes_removed(tmp_path):
+    journal = TransactionJournal(tmp_path / "j.json")
+    journal.begin([("a", "a-1"), ("b", "b-1")])
+    journal.set_state(journal.swaps[1], TransactionJournal.REMOVED)
+    task = FakeAssets(TransactionJournal(journal.path), {"a", "a-1", "b-1"})
+    task.journal_recovery = "rollback"
+
+    task._recover_journal()
+    assert task.assets == {"a", "b"}
+    assert not journal.exists()
@@ -0,0 +1,80 @@
+import fcntl
+import os
+import time
+from task_base.task_status import TaskStatusCoordinator
+
+
+class FakeFetch(object):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, task_ids):
+        self.calls.append(list(task_ids))
+        return [{"id": i, "state": "RUNNING"} for i in task_ids]
+
+
+def test_polls_registered_ids_and_caches_within_interval(tmp_path):
+    fetch = FakeFetch()
+    coordinator = TaskStatusCoordinator(tmp_path, fetch, interval=60)
+
+    statuses = coordinator.get_statuses(["a", "b"])
+    assert [s["id"] for s in statuses] == ["a", "b"]
+    coordinator.get_statuses(["a", "b"])
+    assert fetch.calls == [["a", "b"]]
+
+
+def test_one_poll_covers_every_process(tmp_path):
+    fetch = FakeFetch()
+    first = TaskStatusCoordinator(tmp_path, fetch, interval=0)
+    second = TaskStatusCoordinator(tmp_path, fetch, interval=0)
+
+    first.register(["a"])
+    statuses = second.get_statuses(["b"])
+    assert fetch.calls == [["a", "b"]]
+    assert [s["id"] for s in statuses] == ["b"]
+
+
+def test_ids_not_polled_yet_are_omitted(tmp_path):
+    fetch = FakeFetch()
+    first = TaskStatusCoordinator(tmp_path, fetch, interval=60)
+    second = TaskStatusCoordinator(tmp_path, fetch, interval=60)
+
+    first.get_statuses(["a"])
+    assert second.get_statuses(["a", "b"]) == [{"id": "a", "state": "RUNNING"}]
+    assert fetch.calls == [["a"]]
+
+
+def test_held_lease_returns_cached_statuses(tmp_path):
+    fetch = FakeFetch()
+    coordinator = TaskStatusCoordinator(tmp_path, fetch, interval=0)
+    coordinator.get_statuses(["a"])
+
+    with open(tmp_path / TaskStatusCoordinator.LEASE, "a") as lease:
+        fcntl.flock(lease, fcntl.LOCK_EX)
+        try:
+            statuses = coordinator.get_statuses(["a"])
+        finally:
+            fcntl.flock(lease, fcntl.LOCK_UN)
+    assert statuses == [{"id": "a", "state": "RUNNING"}]
+    assert fetch.calls == [["a"]]
+
+
+def test_expired_registrations_are_dropped(tmp_path):
+    fetch = FakeFetch()
+    stale = TaskStatusCoordinator(tmp_path, fetch, interval=0, expire_after=60)
+    live = TaskStatusCoordinator(tmp_path, fetch, interval=0, expire_after=60)
+
+    stale.register(["old"])
+    an_hour_ago = time.time() - 3600
+    os.utime(stale.registration, (an_hour_ago, an_hour_ago))
+    live.get_statuses(["new"])
+    assert fetch.calls == [["new"]]
+    assert not stale.registration.exists()
+
+
+def test_registering_nothing_removes_registration(tmp_path):
+    coordinator = TaskStatusCoordinator(tmp_path, FakeFetch())
+    coordinator.register(["a"])
+    assert coordinator.registration.exists()
+    coordinator.register([])
+    assert not coordinator.registration.exists()